@@ -1,16 +1,27 @@
 # YourLeagueConsensus.py
 # Custom Fantasy Football Consensus Projections - YOUR EXACT SCORING (Dec 2025)
 
+import time
+_STARTED = time.perf_counter()  # For the headless cold-start report
+
 import sys
 import asyncio
+import argparse
+import functools
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from PyQt6.QtWidgets import *
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSortFilterProxyModel
-from PyQt6.QtGui import QStandardItemModel, QStandardItem
-from playwright.async_api import async_playwright
 import re
 import os
+import json
+import hashlib
+import urllib.parse
+import difflib
+import unicodedata
+import contextlib
+import threading
+import concurrent.futures
+import multiprocessing
 
 # ============================= YOUR EXACT SCORING (HARDCODED) =============================
 CUSTOM_SCORING = {
@@ -69,368 +80,1493 @@ CUSTOM_SCORING = {
     'def_4th_down_stops': 0.5, 'def_tfl': 0.5, 'def_3_and_out': 0.5, 'def_xp_return': 2,
 }
 
-# ============================= SCORING CALCULATOR =============================
+# ============================= SCORING ENGINE =============================
+# Yardage bonuses ("pass_yds_300") and DST allowed tiers ("def_pts_allowed_7_13") are
+# step functions keyed by their lower bound; everything else in a scoring dict is a
+# plain per-stat weight. A tier runs up to the next tier's lower bound, so fractional
+# projections land in the tier below (6.5 points allowed scores like 1-6), where the
+# original integer ranges left gaps that fell through to the last tier.
+_BONUS_KEY = re.compile(r"^(pass_yds|rush_yds|rec_yds)_(\d+)$")
+_TIER_KEY = re.compile(r"^(def_pts_allowed|def_yds_allowed)_(\d+)(?:_\d+|_plus)?$")
+TIER_STATS = {'def_pts_allowed': 'opp_pts', 'def_yds_allowed': 'opp_yds'}
+
+
+def _split_scoring(scoring):
+    """Split a scoring dict into per-stat weights and {stat: [(lower bound, points)]} steps."""
+    linear, bonus, tiers = {}, {}, {}
+    for key, value in scoring.items():
+        m = _BONUS_KEY.match(key)
+        if m:
+            bonus.setdefault(m.group(1), []).append((float(m.group(2)), value))
+            continue
+        m = _TIER_KEY.match(key)
+        if m:
+            tiers.setdefault(TIER_STATS[m.group(1)], []).append((float(m.group(2)), value))
+            continue
+        linear[key] = value
+    return linear, bonus, tiers
+
+
+class ScoringEngine:
+    """Scores whole projection tables against one or more scoring dicts like CUSTOM_SCORING.
+
+    Per-stat weights become a (stats x profiles) matrix for offense/K rows and one for
+    DST rows, and the bonus/tier steps of every profile are merged onto shared
+    thresholds so each is one np.searchsorted into a (bins x profiles) value table.
+    Scoring a DataFrame against 20 leagues is the same handful of array ops as one.
+    """
+
+    def __init__(self, scoring=None, profiles=None):
+        self.profiles = list(profiles) if profiles is not None else ["default"]
+        split = [_split_scoring(s) for s in (profiles.values() if profiles is not None else [scoring])]
+
+        # Matrix columns: every weighted stat plus the stats that only drive steps
+        self.columns = list(dict.fromkeys(k for linear, _, _ in split for k in linear))
+        step_stats = [s for _, bonus, tiers in split for s in list(bonus) + list(tiers)]
+        self.columns += [s for s in dict.fromkeys(step_stats) if s not in self.columns]
+        weights = np.array([[linear.get(c, 0.0) for linear, _, _ in split] for c in self.columns], dtype=float)
+        def_stat = np.array([c.startswith('def_') for c in self.columns])[:, None]
+        self.off_weights = np.where(def_stat, 0.0, weights)
+        self.def_weights = np.where(def_stat, weights, 0.0)
+        # Bonuses pay nothing below the first threshold; the first tier covers everything below the second bound
+        self.bonuses = [self._steps(stat, [bonus.get(stat) for _, bonus, _ in split], floor=0.0)
+                        for stat in dict.fromkeys(s for _, bonus, _ in split for s in bonus)]
+        self.tiers = [self._steps(stat, [tiers.get(stat) for _, _, tiers in split])
+                      for stat in dict.fromkeys(s for _, _, tiers in split for s in tiers)]
+
+    def _steps(self, stat, per_profile, floor=None):
+        """(column, thresholds, values[bin, profile]) for one stat's step functions."""
+        tables = []
+        for steps in per_profile:
+            if not steps:
+                tables.append((np.array([]), np.array([0.0])))
+                continue
+            steps = sorted(steps)
+            bounds = np.array([b for b, _ in steps], dtype=float)
+            values = np.array([v for _, v in steps], dtype=float)
+            if floor is None:
+                tables.append((bounds[1:], values))
+            else:
+                tables.append((bounds, np.concatenate(([floor], values))))
+        thresholds = np.unique(np.concatenate([t for t, _ in tables]))
+        # Every profile is constant between consecutive shared thresholds; sample each bin at its lower edge
+        edges = np.concatenate(([-np.inf], thresholds))
+        values = np.column_stack([v[np.searchsorted(t, edges, side='right')] for t, v in tables])
+        return self.columns.index(stat), thresholds, values
+
+    @staticmethod
+    def _lookup(X, table):
+        col, thresholds, values = table
+        return values[np.searchsorted(thresholds, X[:, col], side='right')]
+
+    def matrix(self, df):
+        """Stat matrix for df in self.columns order (missing stats count as 0)."""
+        return np.nan_to_num(df.reindex(columns=self.columns, fill_value=0).to_numpy(dtype=float))
+
+    def score_matrix_all(self, X, is_def):
+        """(rows x profiles) fantasy points for stat matrix X; is_def selects DST scoring."""
+        off = X @ self.off_weights
+        for table in self.bonuses:
+            off += self._lookup(X, table)
+        dst = X @ self.def_weights
+        for table in self.tiers:
+            dst += self._lookup(X, table)
+        return np.round(np.where(np.asarray(is_def)[:, None], dst, off), 2)
+
+    def score_matrix(self, X, is_def):
+        """Fantasy points under the first profile for each row of stat matrix X."""
+        return self.score_matrix_all(X, is_def)[:, 0]
+
+    def _is_def(self, df):
+        return df['pos'].eq('DST').to_numpy() if 'pos' in df else np.zeros(len(df), dtype=bool)
+
+    def score(self, df):
+        """Fantasy points under the first profile for every row of a projections DataFrame."""
+        return pd.Series(self.score_matrix(self.matrix(df), self._is_def(df)), index=df.index)
+
+    def score_profiles(self, df, prefix="pts_"):
+        """DataFrame of fantasy points with one column per profile (named prefix + profile)."""
+        points = self.score_matrix_all(self.matrix(df), self._is_def(df))
+        return pd.DataFrame(points, index=df.index, columns=[prefix + name for name in self.profiles])
+
+
+SCORING_ENGINE = ScoringEngine(CUSTOM_SCORING)
+
+
 def calculate_fantasy_points(row, is_def=False):
-    pts = 0.0
-
-    if not is_def:
-        # Passing
-        pts += row.get('pass_cmp', 0) * CUSTOM_SCORING['pass_cmp']
-        pts += row.get('pass_yds', 0) * CUSTOM_SCORING['pass_yds']
-        if row.get('pass_yds', 0) >= 400: pts += 4
-        elif row.get('pass_yds', 0) >= 300: pts += 3
-        elif row.get('pass_yds', 0) >= 200: pts += 2
-        pts += row.get('pass_td', 0) * 6
-        pts += row.get('int', 0) * -2
-        pts += row.get('sacks_taken', 0) * -0.25
-        pts += row.get('pick_six', 0) * -2
-        pts += row.get('pass_40_plus_cmp', 0) * 1
-        pts += row.get('pass_40_plus_td', 0) * 1
-        pts += row.get('pass_fd', 0) * 0.1
-
-        # Rushing
-        pts += row.get('rush_att', 0) * 0.35
-        pts += row.get('rush_yds', 0) * 0.1
-        if row.get('rush_yds', 0) >= 200: pts += 4
-        elif row.get('rush_yds', 0) >= 100: pts += 3
-        pts += row.get('rush_td', 0) * 6
-        pts += row.get('rush_40_plus', 0) * 2
-        pts += row.get('rush_40_plus_td', 0) * 1
-        pts += row.get('rush_fd', 0) * 0.2
-
-        # Receiving
-        pts += row.get('rec', 0) * 0.7
-        pts += row.get('rec_yds', 0) * 0.1
-        if row.get('rec_yds', 0) >= 200: pts += 4
-        elif row.get('rec_yds', 0) >= 100: pts += 3
-        pts += row.get('rec_td', 0) * 6
-        pts += row.get('rec_40_plus', 0) * 2
-        pts += row.get('rec_40_plus_td', 0) * 1
-        pts += row.get('rec_fd', 0) * 0.2
-
-        # Misc Offense
-        pts += row.get('two_pt', 0) * 2
-        pts += row.get('fumble_lost', 0) * -2
-        pts += row.get('fumble_td', 0) * 6
-        pts += row.get('return_yds', 0) / 20
-        pts += row.get('return_td', 0) * 6
-
-        # Kicking (basic)
-        pts += row.get('fg_0_19', 0) * 3 + row.get('fg_20_29', 0) * 3 + row.get('fg_30_39', 0) * 4
-        pts += row.get('fg_40_49', 0) * 4 + row.get('fg_50_plus', 0) * 5
-        pts += row.get('fg_miss_0_19', 0) * -1 + row.get('fg_miss_20_29', 0) * -1 + row.get('fg_miss_30_39', 0) * -1
-        pts += row.get('fg_miss_40_49', 0) * -1 + row.get('fg_miss_50_plus', 0) * -1
-        pts += row.get('xp_made', 0) * 1 + row.get('xp_miss', 0) * -1
-    else:
-        # Defense/ST (simplified tiers based on projected pts/yds allowed)
-        pa = row.get('opp_pts', 0)
-        if pa == 0: pts += 12
-        elif 1 <= pa <= 6: pts += 8
-        elif 7 <= pa <= 13: pts += 6
-        elif 14 <= pa <= 20: pts += 4
-        elif 21 <= pa <= 27: pts += 2
-        elif 28 <= pa <= 34: pts += 0
-        else: pts += -5
-
-        ya = row.get('opp_yds', 0)
-        if ya <= 99: pts += 5
-        elif 100 <= ya <= 199: pts += 4
-        elif 200 <= ya <= 299: pts += 2
-        elif 300 <= ya <= 399: pts += 0
-        elif 400 <= ya <= 499: pts += -1
-        else: pts += -3
-
-        pts += row.get('def_sacks', 0) * 2 + row.get('def_int', 0) * 3 + row.get('def_fum_rec', 0) * 3
-        pts += row.get('def_td', 0) * 6 + row.get('def_safety', 0) * 2 + row.get('def_block', 0) * 2
-        pts += row.get('def_return_td', 0) * 6 + row.get('def_4th_down_stops', 0) * 0.5
-        pts += row.get('def_tfl', 0) * 0.5 + row.get('def_3_and_out', 0) * 0.5 + row.get('def_xp_return', 0) * 2
-
-    return round(pts, 2)
+    """Score a single projection dict; whole tables should go through SCORING_ENGINE.score."""
+    X = np.array([[row.get(s, 0) for s in SCORING_ENGINE.columns]], dtype=float)
+    return float(SCORING_ENGINE.score_matrix(X, np.array([is_def]))[0])
 
 # ============================= DATA CACHE =============================
-CACHE_FILE = 'projections_cache.csv'
+SNAPSHOT_DIR = 'projection_snapshots'
+
+# Every numeric stat a proj_row carries (all default to 0)
+STAT_COLUMNS = [
+    "pass_cmp", "pass_att", "pass_yds", "pass_td", "int",
+    "rush_att", "rush_yds", "rush_td",
+    "rec", "rec_yds", "rec_td",
+    "fumble_lost", "two_pt", "return_yds", "return_td",
+    "sacks_taken", "pass_fd", "rush_fd", "rec_fd",
+    "pass_40_plus_cmp", "pass_40_plus_td", "rush_40_plus", "rush_40_plus_td",
+    "rec_40_plus", "rec_40_plus_td", "pick_six",
+    # Kicker/Def specifics
+    "fg_0_19", "fg_20_29", "fg_30_39", "fg_40_49", "fg_50_plus",
+    "fg_miss_0_19", "fg_miss_20_29", "fg_miss_30_39", "fg_miss_40_49", "fg_miss_50_plus",
+    "xp_made", "xp_miss",
+    "def_sacks", "def_int", "def_fum_rec", "def_td", "def_safety", "def_block",
+    "def_return_td", "def_4th_down_stops", "def_tfl", "def_3_and_out", "def_xp_return",
+    "opp_pts", "opp_yds",  # For def tiers
+]
+TEXT_COLUMNS = ["player", "team", "pos", "opp", "source", "week"]
+PROJECTION_COLUMNS = ["season"] + TEXT_COLUMNS + STAT_COLUMNS + ["source_points", "timestamp"]
+
+@functools.lru_cache(maxsize=None)
+def projection_schema():
+    """Arrow schema for stored projection rows (pyarrow is imported on first use)."""
+    import pyarrow as pa
+    return pa.schema(
+        [("season", pa.int16())]
+        + [(c, pa.string()) for c in TEXT_COLUMNS]
+        + [(c, pa.float64()) for c in STAT_COLUMNS]
+        + [("source_points", pa.float64()), ("timestamp", pa.timestamp("us"))]
+    )
+
+@functools.lru_cache(maxsize=None)
+def snapshot_index_schema():
+    import pyarrow as pa
+    return pa.schema([("season", pa.int16()), ("week", pa.string()), ("source", pa.string()),
+                      ("fetched_at", pa.timestamp("us")), ("path", pa.string()), ("rows", pa.int64())])
+# All the GUI needs to rebuild the consensus table at startup
+DISPLAY_COLUMNS = ["player", "team", "pos", "opp", "source", "week", "source_points", "opp_pts", "timestamp"]
+
+SNAPSHOT_KEYS = ["season", "week", "source", "fetched_at"]
+
+def current_season(today=None):
+    """NFL season a date belongs to (January/February games count toward the prior year)."""
+    today = today or datetime.now()
+    return today.year if today.month >= 3 else today.year - 1
 
-def load_cache():
-    if os.path.exists(CACHE_FILE):
-        return pd.read_csv(CACHE_FILE)
-    return pd.DataFrame()
+def _write_parquet(df, path, schema=None):
+    """Write df to path atomically, coerced to schema (default: projection_schema())."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    schema = projection_schema() if schema is None else schema
+    df = df.reindex(columns=schema.names)
+    if schema is projection_schema():
+        df[STAT_COLUMNS + ["source_points"]] = df[STAT_COLUMNS + ["source_points"]].fillna(0)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    pq.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False), tmp)
+    os.replace(tmp, path)
+
+
+class SnapshotStore:
+    """Append-only history of pulls: one Parquet file per (season, week, source, fetch).
+
+    index.parquet maps (season, week, source, fetched_at) to each file and is held in
+    memory as a sorted MultiIndex, so choosing the snapshots for a query is an index
+    lookup and only those files are read, however many snapshots pile up.
+    """
+
+    def __init__(self, root=SNAPSHOT_DIR):
+        self.root = root
+        self.index_path = os.path.join(root, "index.parquet")
+        if os.path.exists(self.index_path):
+            import pyarrow.parquet as pq
+            index = pq.read_table(self.index_path).to_pandas()
+        else:
+            index = snapshot_index_schema().empty_table().to_pandas()
+        self.index = index.set_index(SNAPSHOT_KEYS).sort_index()
+
+    def append(self, df, season=None):
+        """Store one pull (rows stamped with week, source and timestamp) as new snapshots.
+
+        A (week, source) whose newest row is no newer than its latest stored snapshot
+        is skipped: every page was reused from cache, so the snapshot already exists.
+        """
+        season = current_season() if season is None else season
+        entries = []
+        for (week, source), part in df.groupby(["week", "source"], sort=False):
+            fetched_at = pd.Timestamp(part["timestamp"].max()).floor("us")
+            stored = self.as_of(season, week).index
+            stored = stored[stored.get_level_values("source") == source].get_level_values("fetched_at")
+            if len(stored) and stored.max() >= fetched_at:
+                continue
+            rel = os.path.join(str(season), re.sub(r"[^\w.-]", "_", week), re.sub(r"[^\w.-]", "_", source),
+                               f"{fetched_at:%Y%m%dT%H%M%S%f}.parquet")
+            _write_parquet(part.assign(season=season), os.path.join(self.root, rel))
+            entries.append({"season": season, "week": week, "source": source,
+                            "fetched_at": fetched_at, "path": rel, "rows": len(part)})
+        if not entries:
+            return
+        index = pd.concat([self.index.reset_index(), pd.DataFrame(entries)], ignore_index=True)
+        _write_parquet(index, self.index_path, schema=snapshot_index_schema())
+        self.index = index.set_index(SNAPSHOT_KEYS).sort_index()
+
+    def resolve(self, season=None, week=None):
+        """Fill in the latest season and, within it, the most recently pulled week."""
+        if season is None:
+            season = self.index.index.get_level_values("season").max()
+        if week is None:
+            in_season = self.index.loc[season]
+            week = in_season.index[in_season.index.get_level_values("fetched_at").argmax()][0]
+        return season, week
+
+    def as_of(self, season, week, before=None):
+        """Index rows for the newest snapshot of each source, optionally strictly before a fetch time."""
+        try:
+            snaps = self.index.loc[(season, week)]
+        except KeyError:
+            return self.index.iloc[:0].droplevel(["season", "week"])
+        if before is not None:
+            snaps = snaps[snaps.index.get_level_values("fetched_at") < before]
+        return snaps.groupby(level="source").tail(1)
+
+    def read(self, snaps, columns=None):
+        import pyarrow.parquet as pq
+        if columns is not None:
+            columns = [c for c in columns if c in PROJECTION_COLUMNS]
+        frames = [pq.read_table(os.path.join(self.root, path), columns=columns).to_pandas() for path in snaps["path"]]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
+
+    def latest(self, season=None, week=None, columns=None):
+        """Newest snapshot of every source for one week (default: the most recently pulled)."""
+        if self.index.empty:
+            return pd.DataFrame()
+        season, week = self.resolve(season, week)
+        return self.read(self.as_of(season, week), columns)
+
+    def changes(self, season=None, week=None):
+        """Consensus risers, fallers, additions and drops since the previous pull of a week.
+
+        Compares the newest snapshot per source against the newest per source before
+        the latest fetch, so only those files are read. Sorted by delta, biggest riser first.
+        """
+        columns = ["player", "team", "pos", "opp", "source", "source_points", "timestamp"]
+        shown = ["player_id", "player", "team", "pos", "consensus"]
+        if self.index.empty:
+            return pd.DataFrame()
+        season, week = self.resolve(season, week)
+        current = self.as_of(season, week)
+        previous = self.as_of(season, week, before=current.index.get_level_values("fetched_at").max())
+        resolver = PlayerResolver()
+        after = build_rankings(self.read(current, columns), resolver)[shown]
+        if len(previous):
+            before = build_rankings(self.read(previous, columns), resolver)[shown]
+        else:
+            before = pd.DataFrame(columns=shown)
+        diff = after.merge(before, on="player_id", how="outer", suffixes=("", "_before"), indicator=True)
+        for col in ("player", "team", "pos"):
+            diff[col] = diff[col].fillna(diff.pop(f"{col}_before"))
+        diff["delta"] = diff["consensus"] - diff["consensus_before"]
+        side = diff.pop("_merge").astype(str)
+        diff["change"] = np.select([side.eq("left_only"), side.eq("right_only"), diff["delta"].eq(0)],
+                                   ["added", "dropped", "unchanged"], "changed")
+        return diff.sort_values("delta", ascending=False, na_position="last").reset_index(drop=True)
+
+def load_cache(columns=None):
+    """Latest snapshot of every source for the most recently pulled week."""
+    return SnapshotStore().latest(columns=columns)
 
 def save_cache(df):
-    df.to_csv(CACHE_FILE, index=False)
+    """Append df to the snapshot history."""
+    SnapshotStore().append(df)
 
 # ============================= SCRAPERS (2025 WORKING SOURCES) =============================
-async def scrape_sources():
-    all_data = []
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-        page = await context.new_page()
-        page.set_default_timeout(60000)
-
-        # FantasyPros (primary source for consensus stats)
-        positions = [
-            ("https://www.fantasypros.com/nfl/projections/qb.php?week=draft", "QB"),
-            ("https://www.fantasypros.com/nfl/projections/rb.php?week=draft", "RB"),
-            ("https://www.fantasypros.com/nfl/projections/wr.php?week=draft", "WR"),
-            ("https://www.fantasypros.com/nfl/projections/te.php?week=draft", "TE"),
-            ("https://www.fantasypros.com/nfl/projections/k.php?week=draft", "K"),
-            ("https://www.fantasypros.com/nfl/projections/dst.php?week=draft", "DST"),
-        ]
-
-        for url, pos in positions:
+FANTASYPROS_URL = "https://www.fantasypros.com/nfl/projections/{pos}.php?week={week}"
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DST"]
+ROW_SELECTOR = ".table-player-table tbody tr, #dataGridView tbody tr"
+ROW_XPATH = ("//*[contains(concat(' ', normalize-space(@class), ' '), ' table-player-table ')]//tbody/tr"
+             " | //*[@id='dataGridView']//tbody/tr")  # Same rows as ROW_SELECTOR, for lxml
+MAX_PAGES = 4       # Browser pages open at once (JavaScript-rendered sources only)
+PAGE_TIMEOUT = 60   # Seconds per URL before it is abandoned
+
+
+def _cell_text(cell):
+    """Visible text of a <td>, with whitespace collapsed like inner_text()."""
+    return " ".join(" ".join(cell.itertext()).split())
+
+
+def parse_projection_table(html, pos, max_rows=50, counts=None):
+    """Parse a FantasyPros projections page (or just its table) into proj_row dicts.
+
+    Pure function of the HTML, so saved pages can be parsed and benchmarked offline.
+    A counts dict gets "rows_seen", the number of table rows found on the page.
+    """
+    import lxml.html
+    scraped = []
+    rows = lxml.html.fromstring(html).xpath(ROW_XPATH)
+    if counts is not None:
+        counts["rows_seen"] = len(rows)
+    for row in rows[:max_rows]:  # Top 50 per position
+        cols = row.xpath("./td")
+        if len(cols) < 8: continue
+        player_cell = _cell_text(cols[0])
+        # Parse player name and team (e.g., "Josh Allen BUF")
+        match = re.match(r"(.+?)\s([A-Z]{2,3})$", player_cell.strip())
+        player = match.group(1).strip() if match else player_cell.strip()
+        team = match.group(2) if match else ""
+        if not player: continue
+        opp = _cell_text(cols[3]) if len(cols) > 3 else ""  # Opponent
+
+        # Extract stat projections (adjust indices based on pos)
+        stats_text = [_cell_text(c) for c in cols[4:]]  # Skip rank, name, team, bye
+        proj_row = {"player": player, "team": team, "pos": pos, "opp": opp, **dict.fromkeys(STAT_COLUMNS, 0)}
+
+        # Map stats (FantasyPros columns vary by pos; this is approximate—enhance as needed)
+        if pos in ["QB", "RB", "WR", "TE"]:
+            if len(stats_text) >= 12:
+                proj_row['pass_cmp'] = float(re.sub(r'[^\d.]', '', stats_text[0]) or 0)
+                proj_row['pass_yds'] = float(re.sub(r'[^\d.]', '', stats_text[2]) or 0)
+                proj_row['pass_td'] = float(re.sub(r'[^\d.]', '', stats_text[3]) or 0)
+                proj_row['rush_att'] = float(re.sub(r'[^\d.]', '', stats_text[4]) or 0)
+                proj_row['rush_yds'] = float(re.sub(r'[^\d.]', '', stats_text[5]) or 0)
+                proj_row['rush_td'] = float(re.sub(r'[^\d.]', '', stats_text[6]) or 0)
+                proj_row['rec'] = float(re.sub(r'[^\d.]', '', stats_text[7]) or 0)
+                proj_row['rec_yds'] = float(re.sub(r'[^\d.]', '', stats_text[8]) or 0)
+                proj_row['rec_td'] = float(re.sub(r'[^\d.]', '', stats_text[9]) or 0)
+                proj_row['fumble_lost'] = float(re.sub(r'[^\d.]', '', stats_text[10]) or 0)
+                # Estimate bonuses (rough; real projections might need more sources)
+                proj_row['pass_fd'] = proj_row['pass_yds'] / 20  # Approx
+                proj_row['rush_fd'] = proj_row['rush_yds'] / 10
+                proj_row['rec_fd'] = proj_row['rec_yds'] / 10
+                proj_row['sacks_taken'] = 2 if pos == "QB" else 0  # Default low
+                proj_row['pass_40_plus_cmp'] = max(0, proj_row['pass_td'] - 1)  # Rough est
+                # ... (similar rough est for 40+ plays; improve with more scrapers if needed)
+
+        elif pos == "K":
+            if len(stats_text) >= 6:
+                proj_row['fg_0_19'] = float(stats_text[0] or 0)
+                proj_row['fg_20_29'] = float(stats_text[1] or 0)
+                proj_row['fg_30_39'] = float(stats_text[2] or 0)
+                proj_row['fg_40_49'] = float(stats_text[3] or 0)
+                proj_row['fg_50_plus'] = float(stats_text[4] or 0)
+                proj_row['xp_made'] = float(stats_text[5] or 0)
+
+        elif pos == "DST":
+            if len(stats_text) >= 4:
+                proj_row['def_sacks'] = float(stats_text[0] or 0)
+                proj_row['def_int'] = float(stats_text[1] or 0)
+                proj_row['def_fum_rec'] = float(stats_text[2] or 0)
+                proj_row['def_td'] = float(stats_text[3] or 0)
+                proj_row['opp_pts'] = 20  # Default avg; scrape real opp proj if possible
+                proj_row['opp_yds'] = 350  # Default avg
+                proj_row['def_4th_down_stops'] = 1  # Est
+                # ... (add more as per projections)
+
+        scraped.append(proj_row)
+    return scraped
+
+
+# ============================= RUN REPORT =============================
+RUN_REPORT_DIR = 'run_reports'
+RUN_REPORT_KEEP = 200  # Newest reports kept; older ones are deleted on save
+
+
+class RunReport:
+    """Timing spans, per-URL counters and errors for one update, saved as JSON.
+
+    Each span is a stage name, an optional URL, its start (seconds into the run) and
+    its duration. pages holds one counter dict per URL: status, backend, navigation
+    time, bytes transferred (response bodies as sent, before decompression; for the
+    browser, every request the page made), rows parsed and dropped, errors. Work is
+    counted in units (a page, a stage): callers expect() units up front and advance()
+    as each finishes, and on_progress(done, total, message) is called on every advance.
+    """
+
+    def __init__(self, on_progress=None):
+        self.started_at = datetime.now()
+        self._t0 = time.perf_counter()
+        self.on_progress = on_progress
+        self.spans = []
+        self.pages = {}
+        self.errors = []
+        self.done = 0
+        self.total = 0
+
+    @contextlib.contextmanager
+    def span(self, stage, url=None):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans.append({"stage": stage, "url": url, "start": round(start - self._t0, 4),
+                               "seconds": round(time.perf_counter() - start, 4)})
+
+    def page(self, url, **fields):
+        counters = self.pages.setdefault(url, {
+            "url": url, "status": "pending", "backend": None, "navigation_s": 0.0,
+            "bytes": 0, "rows_parsed": 0, "rows_dropped": 0, "errors": 0,
+        })
+        counters.update(fields)
+        return counters
+
+    def error(self, stage, exc, url=None):
+        self.errors.append({"stage": stage, "url": url, "error": repr(exc),
+                            "at": round(time.perf_counter() - self._t0, 4)})
+        if url is not None:
+            self.page(url)["errors"] += 1
+
+    def expect(self, units):
+        self.total += units
+
+    def advance(self, message, units=1):
+        self.done += units
+        if self.on_progress is not None:
+            self.on_progress(self.done, self.total, message)
+
+    def stages(self):
+        """Total seconds, count and slowest span per stage."""
+        totals = {}
+        for span in self.spans:
+            stage = totals.setdefault(span["stage"], {"seconds": 0.0, "count": 0, "max_s": 0.0})
+            stage["seconds"] = round(stage["seconds"] + span["seconds"], 4)
+            stage["count"] += 1
+            stage["max_s"] = max(stage["max_s"], span["seconds"])
+        return totals
+
+    def as_dict(self):
+        pages = list(self.pages.values())
+        return {
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "seconds": round(time.perf_counter() - self._t0, 4),
+            "totals": {key: sum(p[key] for p in pages) for key in ("bytes", "rows_parsed", "rows_dropped", "errors")},
+            "stages": self.stages(),
+            "pages": pages,
+            "spans": self.spans,
+            "errors": self.errors,
+        }
+
+    def save(self, directory=RUN_REPORT_DIR, keep=RUN_REPORT_KEEP):
+        """Write the report to directory/run_<started>.json and return its path.
+
+        Only the newest keep reports in directory are kept; older ones are deleted.
+        """
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"run_{self.started_at:%Y%m%d_%H%M%S_%f}.json")
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.as_dict(), f, indent=1, default=str)
+        os.replace(tmp, path)
+        # Names sort by start time
+        reports = sorted(f for f in os.listdir(directory) if f.startswith("run_") and f.endswith(".json"))
+        for old in reports[:max(0, len(reports) - keep)]:
+            with contextlib.suppress(OSError):
+                os.remove(os.path.join(directory, old))
+        return path
+
+    def summary(self):
+        rows = sum(p["rows_parsed"] for p in self.pages.values())
+        return (f"{len(self.pages)} pages, {rows} rows, {len(self.errors)} error{'s' if len(self.errors) != 1 else ''} "
+                f"in {time.perf_counter() - self._t0:.1f}s")
+
+
+# ============================= FETCH BACKENDS =============================
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+HTTP_CONNECTIONS = 8  # Keep-alive connections shared by every HTTP fetch
+# The browser only needs the DOM: these resource types and ad/analytics hosts are
+# aborted before they are requested
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+BLOCKED_DOMAINS = (
+    "doubleclick.net", "googlesyndication.com", "googletagservices.com", "google-analytics.com",
+    "googletagmanager.com", "amazon-adsystem.com", "adnxs.com", "criteo.com", "taboola.com",
+    "outbrain.com", "scorecardresearch.com", "quantserve.com", "facebook.net", "hotjar.com",
+)
+
+
+class HttpFetcher:
+    """Plain GETs over one pooled keep-alive client; no JavaScript is run."""
+
+    def __init__(self, max_connections=HTTP_CONNECTIONS):
+        import httpx
+        self.limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+
+    async def __aenter__(self):
+        import httpx
+        self.client = httpx.AsyncClient(headers={"User-Agent": USER_AGENT}, limits=self.limits,
+                                        timeout=PAGE_TIMEOUT, follow_redirects=True)
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.client.aclose()
+
+    async def fetch(self, url, selector=None, cached=None, report=None):
+        """Return (html, etag, last_modified); html is None when the server says 304."""
+        report = RunReport() if report is None else report
+        headers = {}
+        if cached is not None:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        with report.span("http_get", url):
+            resp = await self.client.get(url, headers=headers)
+        report.page(url)["bytes"] += resp.num_bytes_downloaded
+        if resp.status_code == 304 and cached is not None:
+            return None, cached.get("etag"), cached.get("last_modified")
+        resp.raise_for_status()
+        return resp.text, resp.headers.get("etag"), resp.headers.get("last-modified")
+
+
+def _blocked(request):
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
+        return True
+    host = request.url.split("/")[2].split(":")[0] if "://" in request.url else ""
+    return any(host == d or host.endswith("." + d) for d in BLOCKED_DOMAINS)
+
+
+class BrowserFetcher:
+    """Pool of Chromium pages for pages whose tables are rendered by JavaScript.
+
+    Chromium is only launched on the first fetch, so runs where every source is
+    served over HTTP never pay for browser startup, and it stays up (relaunched if
+    it died) for as long as the fetcher is open. A launch that fails is torn down
+    and its error re-raised for every other page of the same update (same report)
+    instead of being retried per page. Images, fonts, media and tracker hosts are
+    blocked, and a page is ready once its DOM is parsed and the table selector has
+    appeared, not when the network goes idle.
+    """
+
+    def __init__(self, max_pages=MAX_PAGES):
+        self.max_pages = max(1, max_pages)
+        self.browser = None
+        self.blocked = 0  # Requests aborted since the browser was launched
+        self._playwright = None
+        self._launch_error = None  # (report, exception) of the last failed launch
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self._stop()
+
+    async def _stop(self):
+        browser, playwright = self.browser, self._playwright
+        self.browser = self._playwright = None
+        if browser is not None:
+            with contextlib.suppress(Exception):
+                await browser.close()
+        if playwright is not None:
+            # Also when the launch itself failed: the driver process is already running
+            with contextlib.suppress(Exception):
+                await playwright.stop()
+
+    async def _route(self, route):
+        if _blocked(route.request):
+            self.blocked += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _start(self, report):
+        async with self._lock:
+            if self.browser is not None and self.browser.is_connected():
+                return
+            if self._launch_error is not None and self._launch_error[0] is report:
+                raise self._launch_error[1]
+            await self._stop()
             try:
-                await page.goto(url, wait_until="networkidle", timeout=30000)
-                # Updated selector for 2025 FantasyPros layout
-                await page.wait_for_selector(".table-player-table tbody tr, #dataGridView tbody tr", timeout=20000)
-                rows = await page.query_selector_all(".table-player-table tbody tr, #dataGridView tbody tr")
-                for row in rows[:50]:  # Top 50 per position
-                    cols = await row.query_selector_all("td")
-                    if len(cols) < 8: continue
-                    player_cell = await cols[0].inner_text()
-                    # Parse player name and team (e.g., "Josh Allen BUF")
-                    match = re.match(r"(.+?)\s([A-Z]{2,3})$", player_cell.strip())
-                    player = match.group(1).strip() if match else player_cell.strip()
-                    team = match.group(2) if match else ""
-                    opp = await cols[3].inner_text() if len(cols) > 3 else ""  # Opponent
-
-                    # Extract stat projections (adjust indices based on pos)
-                    stats_text = [await c.inner_text() for c in cols[4:]]  # Skip rank, name, team, bye
-                    proj_row = {
-                        "player": player, "team": team, "pos": pos, "opp": opp,
-                        "pass_cmp": 0, "pass_att": 0, "pass_yds": 0, "pass_td": 0, "int": 0,
-                        "rush_att": 0, "rush_yds": 0, "rush_td": 0,
-                        "rec": 0, "rec_yds": 0, "rec_td": 0,
-                        "fumble_lost": 0, "two_pt": 0, "return_yds": 0, "return_td": 0,
-                        "sacks_taken": 0, "pass_fd": 0, "rush_fd": 0, "rec_fd": 0,
-                        "pass_40_plus_cmp": 0, "pass_40_plus_td": 0, "rush_40_plus": 0, "rush_40_plus_td": 0,
-                        "rec_40_plus": 0, "rec_40_plus_td": 0, "pick_six": 0,
-                        # Kicker/Def specifics
-                        "fg_0_19": 0, "fg_20_29": 0, "fg_30_39": 0, "fg_40_49": 0, "fg_50_plus": 0,
-                        "fg_miss_0_19": 0, "fg_miss_20_29": 0, "fg_miss_30_39": 0, "fg_miss_40_49": 0, "fg_miss_50_plus": 0,
-                        "xp_made": 0, "xp_miss": 0,
-                        "def_sacks": 0, "def_int": 0, "def_fum_rec": 0, "def_td": 0, "def_safety": 0, "def_block": 0,
-                        "def_return_td": 0, "def_4th_down_stops": 0, "def_tfl": 0, "def_3_and_out": 0, "def_xp_return": 0,
-                        "opp_pts": 0, "opp_yds": 0  # For def tiers
-                    }
-
-                    # Map stats (FantasyPros columns vary by pos; this is approximate—enhance as needed)
-                    if pos in ["QB", "RB", "WR", "TE"]:
-                        if len(stats_text) >= 12:
-                            proj_row['pass_cmp'] = float(re.sub(r'[^\d.]', '', stats_text[0]) or 0)
-                            proj_row['pass_yds'] = float(re.sub(r'[^\d.]', '', stats_text[2]) or 0)
-                            proj_row['pass_td'] = float(re.sub(r'[^\d.]', '', stats_text[3]) or 0)
-                            proj_row['rush_att'] = float(re.sub(r'[^\d.]', '', stats_text[4]) or 0)
-                            proj_row['rush_yds'] = float(re.sub(r'[^\d.]', '', stats_text[5]) or 0)
-                            proj_row['rush_td'] = float(re.sub(r'[^\d.]', '', stats_text[6]) or 0)
-                            proj_row['rec'] = float(re.sub(r'[^\d.]', '', stats_text[7]) or 0)
-                            proj_row['rec_yds'] = float(re.sub(r'[^\d.]', '', stats_text[8]) or 0)
-                            proj_row['rec_td'] = float(re.sub(r'[^\d.]', '', stats_text[9]) or 0)
-                            proj_row['fumble_lost'] = float(re.sub(r'[^\d.]', '', stats_text[10]) or 0)
-                            # Estimate bonuses (rough; real projections might need more sources)
-                            proj_row['pass_fd'] = proj_row['pass_yds'] / 20  # Approx
-                            proj_row['rush_fd'] = proj_row['rush_yds'] / 10
-                            proj_row['rec_fd'] = proj_row['rec_yds'] / 10
-                            proj_row['sacks_taken'] = 2 if pos == "QB" else 0  # Default low
-                            proj_row['pass_40_plus_cmp'] = max(0, proj_row['pass_td'] - 1)  # Rough est
-                            # ... (similar rough est for 40+ plays; improve with more scrapers if needed)
-
-                    elif pos == "K":
-                        if len(stats_text) >= 6:
-                            proj_row['fg_0_19'] = float(stats_text[0] or 0)
-                            proj_row['fg_20_29'] = float(stats_text[1] or 0)
-                            proj_row['fg_30_39'] = float(stats_text[2] or 0)
-                            proj_row['fg_40_49'] = float(stats_text[3] or 0)
-                            proj_row['fg_50_plus'] = float(stats_text[4] or 0)
-                            proj_row['xp_made'] = float(stats_text[5] or 0)
-
-                    elif pos == "DST":
-                        if len(stats_text) >= 4:
-                            proj_row['def_sacks'] = float(stats_text[0] or 0)
-                            proj_row['def_int'] = float(stats_text[1] or 0)
-                            proj_row['def_fum_rec'] = float(stats_text[2] or 0)
-                            proj_row['def_td'] = float(stats_text[3] or 0)
-                            proj_row['opp_pts'] = 20  # Default avg; scrape real opp proj if possible
-                            proj_row['opp_yds'] = 350  # Default avg
-                            proj_row['def_4th_down_stops'] = 1  # Est
-                            # ... (add more as per projections)
-
-                    proj_row['source_points'] = calculate_fantasy_points(proj_row, is_def=(pos == "DST"))
-                    all_data.append(proj_row)
-            except Exception as e:
-                print(f"Error scraping {url}: {e}")
-                continue
+                with report.span("browser_launch"):
+                    from playwright.async_api import async_playwright
+                    self._playwright = await async_playwright().start()
+                    self.browser = await self._playwright.chromium.launch(headless=True)
+                    self.context = await self.browser.new_context(user_agent=USER_AGENT)
+                    await self.context.route("**/*", self._route)
+            except BaseException as e:
+                await self._stop()
+                if isinstance(e, Exception):
+                    self._launch_error = (report, e)
+                raise
+            self._launch_error = None
+            self.context.set_default_timeout(60000)
+            # None slots are opened lazily and stand in for pages closed after a failure
+            self.pool = asyncio.Queue()
+            for _ in range(self.max_pages):
+                self.pool.put_nowait(None)
 
-        # Add secondary sources (e.g., ESPN for backups)
+    async def fetch(self, url, selector=None, cached=None, report=None):
+        """Return (html, None, None); rendered pages carry no usable validators."""
+        report = RunReport() if report is None else report
+        await self._start(report)
+        # A relaunch while this page is out replaces both; the page goes back to the pool it came from
+        pool, context = self.pool, self.context
+        page = await pool.get()
         try:
-            await page.goto("https://fantasy.espn.com/football/players/projections", wait_until="networkidle")
-            # Similar parsing logic here—abbreviated for space; expand if needed
-            rows = await page.query_selector_all(".Table__TR--sm")
-            for row in rows[:20]:
-                # Parse ESPN table...
-                pass  # Placeholder: implement full if primary fails
-        except:
-            pass
+            page = page or await context.new_page()
+        except BaseException:
+            pool.put_nowait(None)  # Keep the slot
+            raise
+        finished = []  # Requests this navigation completed, for the bytes counter
 
-        await browser.close()
+        def on_finished(request):
+            finished.append(request)
+        page.on("requestfinished", on_finished)
+        try:
+            with report.span("navigate", url):
+                await page.goto(url, wait_until="domcontentloaded" if selector else "load", timeout=30000)
+            if selector:
+                with report.span("wait_selector", url):
+                    await page.wait_for_selector(selector, state="attached", timeout=20000)
+            html = await page.content()
+            page.remove_listener("requestfinished", on_finished)
+            sizes = await asyncio.gather(*(request.sizes() for request in finished), return_exceptions=True)
+            report.page(url)["bytes"] += sum(s["responseBodySize"] for s in sizes if isinstance(s, dict))
+        except BaseException:
+            # The page may be stuck mid-navigation (or cancelled by a timeout); don't reuse it
+            with contextlib.suppress(Exception):
+                await page.close()
+            page = None
+            raise
+        finally:
+            pool.put_nowait(page)
+        return html, None, None
 
-    # Combine with cache if fresh data low
-    cached = load_cache()
-    if not all_data:
-        return cached
-    df = pd.DataFrame(all_data)
-    if not cached.empty:
-        df = pd.concat([df, cached]).drop_duplicates(subset=['player', 'pos'])
-    save_cache(df)
-    return df
 
-# ============================= WORKER THREAD =============================
-class ScrapeThread(QThread):
-    finished = pyqtSignal(pd.DataFrame)
-    progress = pyqtSignal(str)
+class BrowserSession:
+    """Fetchers kept open across updates on an event loop running in its own thread.
 
-    def run(self):
-        self.progress.emit("Checking cache... Scraping fresh projections from FantasyPros + others...")
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        df = loop.run_until_complete(scrape_sources())
-        loop.close()
+    The HTTP client's keep-alive connections and the Chromium instance (once a page
+    needed it) survive between scrape() calls, so only the first update pays for
+    browser startup. scrape() blocks the calling thread until the update is done;
+    call close() once, when the owner shuts down.
+    """
 
-        if df.empty:
-            self.progress.emit("No data—check internet or try again!")
+    def __init__(self, max_pages=MAX_PAGES):
+        self.max_pages = max_pages
+        self.fetchers = None
+        self.loop = asyncio.new_event_loop()
+        self._stack = contextlib.AsyncExitStack()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="browser-session", daemon=True)
+        self._thread.start()
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    async def _scrape(self, **kwargs):
+        if self.fetchers is None:
+            self.fetchers = {"http": await self._stack.enter_async_context(HttpFetcher()),
+                             "browser": await self._stack.enter_async_context(BrowserFetcher(self.max_pages))}
+        return await scrape_sources(fetchers=self.fetchers, **kwargs)
+
+    def scrape(self, **kwargs):
+        """scrape_sources(**kwargs) with this session's fetchers."""
+        return self._run(self._scrape(**kwargs))
+
+    def close(self):
+        if not self._thread.is_alive():
+            return
+        try:
+            self._run(self._stack.aclose())
+        finally:
+            self.fetchers = None
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+            self.loop.close()
+
+
+# ============================= FETCH CACHE =============================
+FETCH_CACHE_FILE = 'fetch_cache.json'
+FETCH_CACHE_TTL = 30 * 60  # Seconds a page is trusted without even revalidating
+
+
+class FetchCache:
+    """Validators, content hash and parsed rows for each (url, week) fetched.
+
+    hits counts pages served from cache (inside the TTL, 304 Not Modified, or an
+    unchanged body); misses counts pages that had to be parsed.
+    """
+
+    def __init__(self, path=FETCH_CACHE_FILE, ttl=FETCH_CACHE_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.entries = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable fetch cache {path}: {e}")
+
+    def lookup(self, url, week):
+        return self.entries.get(f"{week}|{url}")
+
+    def is_fresh(self, entry):
+        return time.time() - entry["checked_at"] < self.ttl
+
+    def reuse(self, entry):
+        entry["checked_at"] = time.time()
+        self.hits += 1
+        return entry["rows"]
+
+    def fetched_at(self, entry):
+        """When the entry's rows were parsed from a changed page (older entries: last checked)."""
+        return entry.get("fetched_at", entry["checked_at"])
+
+    def store(self, url, week, rows, content_hash, etag, last_modified, fetched_at=None):
+        self.misses += 1
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        if rows:
+            self.entries[f"{week}|{url}"] = {
+                "rows": rows, "hash": content_hash, "etag": etag,
+                "last_modified": last_modified, "checked_at": fetched_at, "fetched_at": fetched_at,
+            }
+
+    def save(self):
+        if not self.path:
             return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.entries, f)
+        os.replace(tmp, self.path)
+
+    def summary(self):
+        return f"Fetch cache: {self.hits} hit{'s' if self.hits != 1 else ''}, {self.misses} miss{'es' if self.misses != 1 else ''}"
+
+
+# Each source names its fetch backend; "http" sources fall back to the browser when the
+# table isn't in the served HTML. ESPN renders its projections client-side, so it would
+# be added here with backend "browser" once it has a parser. A parser is called as
+# parser(html, pos, counts=counts) and returns row dicts; it must accept the counts
+# keyword and set counts["rows_seen"] to the table rows it found, so the run report can
+# tell rows it dropped (like parse_projection_table does).
+SOURCES = {
+    "FantasyPros": {
+        "url": FANTASYPROS_URL,
+        "positions": POSITIONS,
+        "selector": ROW_SELECTOR,
+        "parser": parse_projection_table,
+        "backend": "http",
+    },
+}
+
+
+def _reuse(cache, entry, counters, status):
+    fetched_at = cache.fetched_at(entry)
+    rows = cache.reuse(entry)
+    counters.update(status=status, rows_parsed=len(rows))
+    return rows, fetched_at
+
+
+async def _fetch_rows(fetchers, spec, url, pos, week, cache=None, report=None):
+    """Fetch and parse one page with the source's backend, falling back to the browser.
+
+    With a FetchCache, pages inside the TTL are not requested at all, and pages that
+    come back 304 or byte-identical reuse their cached rows instead of being re-parsed.
+    The page's counters and spans go to report. Returns (rows, fetched_at): the epoch
+    time the rows were parsed, which for reused rows is the original fetch.
+    """
+    import httpx
+    report = RunReport() if report is None else report
+    counters = report.page(url, pos=pos, week=week)
+    entry = cache.lookup(url, week) if cache is not None else None
+    if entry is not None and cache.is_fresh(entry):
+        return _reuse(cache, entry, counters, "cached")
+    backends = [spec["backend"]] if spec["backend"] == "browser" else [spec["backend"], "browser"]
+    for backend in backends:
+        counters["backend"] = backend
+        start = time.perf_counter()
+        try:
+            html, etag, last_modified = await fetchers[backend].fetch(url, spec["selector"], entry, report=report)
+        except httpx.HTTPError as e:
+            # Recorded, then retried in the browser
+            report.error(f"fetch_{backend}", e, url)
+            continue
+        finally:
+            counters["navigation_s"] = round(counters["navigation_s"] + time.perf_counter() - start, 4)
+        if html is None:
+            return _reuse(cache, entry, counters, "not_modified")
+        content_hash = hashlib.sha256(html.encode()).hexdigest()
+        if entry is not None and content_hash == entry["hash"]:
+            return _reuse(cache, entry, counters, "unchanged")
+        parsed = {}
+        with report.span("parse", url):
+            rows = spec["parser"](html, pos, counts=parsed)
+        counters.update(status="parsed", rows_parsed=len(rows),
+                        rows_dropped=parsed.get("rows_seen", len(rows)) - len(rows))
+        if rows or backend == "browser":
+            fetched_at = time.time()
+            if cache is not None:
+                cache.store(url, week, rows, content_hash, etag, last_modified, fetched_at)
+            return rows, fetched_at
+        # Table not in the served HTML (rendered client-side): fall back to the browser
+    counters["status"] = "failed"
+    return [], None
+
+
+async def scrape_sources(weeks=("draft",), sources=None, fetchers=None, max_pages=MAX_PAGES, fetch_cache=None,
+                         report=None):
+    """Scrape every position of every source for each week.
+
+    Pages are fetched concurrently (HTTP connections and browser pages are both
+    pooled), each URL gets its own timeout and a failed URL only loses its own rows,
+    so wall time tracks the slowest page rather than the sum. Pass a custom sources
+    dict to point the scraper at a local fixture server, or a {backend: fetcher}
+    dict to plug in other backends (it must include "browser" for fallbacks).
+    fetch_cache defaults to the on-disk FetchCache; its hit/miss counts are left on it.
+    report (a RunReport) collects timings, per-URL counters and errors, and advances
+    one unit per page plus one for saving the snapshot.
+    """
+    fetch_cache = FetchCache() if fetch_cache is None else fetch_cache
+    report = RunReport() if report is None else report
+    sources = SOURCES if sources is None else sources
+    tasks = [(name, spec, str(week), pos, spec["url"].format(pos=pos.lower(), week=week))
+             for name, spec in sources.items() for week in weeks for pos in spec["positions"]]
+    report.expect(len(tasks) + 1)
+
+    async def scrape_page(name, spec, week, pos, url):
+        report.page(url, source=name)
+        try:
+            return await asyncio.wait_for(_fetch_rows(fetchers, spec, url, pos, week, fetch_cache, report),
+                                          PAGE_TIMEOUT)
+        except Exception as e:
+            report.error("scrape", e, url)
+            report.page(url, status="error")
+            return [], None
+        finally:
+            report.advance(f"Scraped {name} {pos} ({report.page(url)['status']})")
+
+    all_data = []
+    async with contextlib.AsyncExitStack() as stack:
+        if fetchers is None:
+            fetchers = {"http": await stack.enter_async_context(HttpFetcher()),
+                        "browser": await stack.enter_async_context(BrowserFetcher(max_pages))}
+        with report.span("scrape"):
+            results = await asyncio.gather(*(scrape_page(*task) for task in tasks))
+        for (name, _, week, _, _), (rows, fetched_at) in zip(tasks, results):
+            if rows:
+                stamp = datetime.fromtimestamp(fetched_at)
+                all_data.extend({**row, "source": name, "week": week, "timestamp": stamp} for row in rows)
+    fetch_cache.save()
+
+    # Record this pull, then answer with the newest snapshot of every source so a
+    # source that failed this time still contributes its last good pull. Rows carry
+    # the time their page was fetched, so a pull served entirely from cache is not
+    # stored again.
+    with report.span("snapshot"):
+        store = SnapshotStore()
+        if all_data:
+            df = pd.DataFrame(all_data)
+            df['source_points'] = SCORING_ENGINE.score(df)
+            store.append(df)
+        latest = (pd.DataFrame() if store.index.empty
+                  else pd.concat([store.latest(week=str(week)) for week in weeks], ignore_index=True))
+    report.advance("Saved snapshot")
+    return latest
+
+
+# ============================= PLAYER IDENTITY =============================
+ALIAS_FILE = 'player_aliases.json'
+NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
+FUZZY_CUTOFF = 0.88  # difflib ratio a near-miss name needs to join an existing player
+
+def normalize_name(name):
+    """Comparison key for a player name: "Kenneth Walker III" -> "kenneth walker", "A.J. Brown" -> "aj brown".
+
+    Names with no ASCII letters keep their own word characters; a name with none
+    at all (blank, "—") normalizes to "".
+    """
+    ascii_name = unicodedata.normalize("NFKD", str(name)).encode("ascii", "ignore").decode().lower()
+    tokens = re.sub(r"[^a-z0-9 ]", " ", re.sub(r"[.'`]", "", ascii_name)).split()
+    key = " ".join(t for t in tokens if t not in NAME_SUFFIXES)
+    return key or " ".join(re.sub(r"[\W_]", " ", str(name).casefold()).split())
+
+
+class PlayerResolver:
+    """Persistent alias table from (pos, normalized name) to a canonical player_id.
+
+    Known spellings resolve with one dict lookup. A miss is compared only against
+    players at the same position whose surname is within a couple of typos: every
+    player is filed under its surname and each one-letter deletion of it, and a
+    query looks up its own, so "K. Walker" or "Kenneth Walkr" finds "Kenneth Walker III"
+    while blocks stay a handful of players however large the pool grows. If nothing
+    is close enough it becomes a new player. Teams are not part of the key, so a
+    player who changed teams keeps the same id. Team defenses are matched exactly
+    ("NYG"/"NYJ" are one letter apart), and a name that normalizes to nothing
+    resolves to None.
+    """
+
+    def __init__(self, path=ALIAS_FILE):
+        self.path = path
+        self.aliases = {}  # "pos|normalized name" -> player_id
+        self.players = {}  # player_id -> {"name", "pos", "key"}
+        self.dirty = False
+        if path and os.path.exists(path):
+            try:
+                with open(path) as f:
+                    saved = json.load(f)
+                self.aliases, self.players = saved["aliases"], saved["players"]
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Ignoring unreadable alias table {path}: {e}")
+        self._blocks = {}  # (pos, surname or surname minus one letter) -> [player_id]
+        for pid, info in self.players.items():
+            self._file(pid, self._block_keys(info["pos"], info["key"]))
+
+    @staticmethod
+    def _block_keys(pos, key):
+        if pos == "DST":
+            return []
+        surname = key.rsplit(" ", 1)[-1]
+        variants = {surname[:i] + surname[i + 1:] for i in range(len(surname))} if len(surname) > 2 else set()
+        variants.add(surname)
+        return [(pos, v) for v in variants]
+
+    def _file(self, pid, blocks):
+        for block in blocks:
+            self._blocks.setdefault(block, []).append(pid)
+
+    def resolve(self, name, pos):
+        key = normalize_name(name)
+        if not key:
+            return None
+        alias = f"{pos}|{key}"
+        pid = self.aliases.get(alias)
+        if pid is None:
+            blocks = self._block_keys(pos, key)
+            pid = self._closest(key, blocks)
+            if pid is None:
+                pid = f"{pos}:{key}"
+                self.players[pid] = {"name": name, "pos": pos, "key": key}
+                self._file(pid, blocks)
+            elif len(key.split()[0]) > len(self.players[pid]["key"].split()[0]):
+                self.players[pid]["name"] = name  # Prefer "Kenneth Walker III" over "K. Walker"
+            self.aliases[alias] = pid
+            self.dirty = True
+        return pid
+
+    def _closest(self, key, blocks):
+        candidates = dict.fromkeys(pid for block in blocks for pid in self._blocks.get(block, ()))
+        if not candidates:
+            return None
+        first = key.split()[0]
+        best, best_score, tied = None, FUZZY_CUTOFF, False
+        for pid in candidates:
+            other = self.players[pid]["key"]
+            other_first = other.split()[0]
+            if len(first) == 1 or len(other_first) == 1:
+                # Initial vs full first name: same initial and surname is a match
+                score = 1.0 if first[0] == other_first[0] and key.split()[1:] == other.split()[1:] else 0.0
+            else:
+                # Cheap upper bounds first, as difflib.get_close_matches does
+                matcher = difflib.SequenceMatcher(None, key, other)
+                if matcher.real_quick_ratio() < best_score or matcher.quick_ratio() < best_score:
+                    continue
+                score = matcher.ratio()
+            if score > best_score:
+                best, best_score, tied = pid, score, False
+            elif score == best_score and best is not None:
+                tied = True
+        return None if tied else best
+
+    def save(self):
+        if not self.path or not self.dirty:
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"aliases": self.aliases, "players": self.players}, f)
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+def resolve_players(df, resolver=None):
+    """Return df with a player_id column and canonical player names.
+
+    Only distinct (player, pos) pairs go through the resolver; rows pick their id up
+    with a join. Rows whose name has nothing to match on (blank cells) are dropped.
+    """
+    resolver = PlayerResolver() if resolver is None else resolver
+    if df.empty:
+        return df.assign(player_id=pd.Series(dtype=str))
+    pair = df["pos"].astype(str) + "|" + df["player"].astype(str)
+    codes, uniques = pd.factorize(pair)
+    ids = np.array([resolver.resolve(*u.split("|", 1)[::-1]) for u in uniques], dtype=object)
+    df = df.assign(player_id=ids[codes])
+    df = df[df["player_id"].notna()]
+    df["player"] = df["player_id"].map({pid: resolver.players[pid]["name"] for pid in set(ids) if pid is not None})
+    resolver.save()
+    return df
+
+# ============================= CONSENSUS =============================
+SOURCE_WEIGHTS = {"FantasyPros": 1.0}  # Sources not listed weigh 1.0
+CONSENSUS_QUANTILES = {"floor": 0.1, "ceiling": 0.9}
+CONSENSUS_KEYS = ["player", "team", "pos"]
+
+def compute_consensus(df, weights=None, quantiles=None, keys=None, mean_columns=("opp_pts",)):
+    """Collapse per-source projection rows into one ranked row per player.
+
+    Rows are numbered by group once and sorted once by (group, source_points); every
+    statistic then comes from that order: weighted mean/std and mean_columns via
+    np.add.reduceat, quantiles by indexing into each sorted run, and the source
+    count from the distinct (group, source) pairs. Carried text columns (team, opp)
+    come from each player's highest-weight source, newest pull first among equals.
+    """
+    weights = SOURCE_WEIGHTS if weights is None else weights
+    quantiles = CONSENSUS_QUANTILES if quantiles is None else quantiles
+    keys = CONSENSUS_KEYS if keys is None else list(keys)
+    mean_columns = [c for c in mean_columns if c in df]
+    if df.empty:
+        return pd.DataFrame(columns=keys + ["consensus", "std", "sources"] + list(quantiles) + mean_columns)
+
+    group = df.groupby(keys, sort=False, dropna=False).ngroup().to_numpy()
+    pts = df["source_points"].to_numpy(dtype=float)
+    source = df["source"] if "source" in df else pd.Series("", index=df.index)
+    w = source.map(weights).fillna(1.0).to_numpy(dtype=float)
+    stamps = (df["timestamp"].to_numpy().astype("datetime64[us]").view("int64") if "timestamp" in df
+              else np.zeros(len(df), dtype="int64"))
+    order = np.lexsort((pts, group))
+    g, x = group[order], pts[order]
+    starts = np.flatnonzero(np.r_[True, g[1:] != g[:-1]])
+    counts = np.diff(np.r_[starts, len(g)])
+    # Same group runs as order; the last row of each is the heaviest source, then the newest, then by name
+    shown = np.lexsort((pd.factorize(source.to_numpy(), sort=True)[0], stamps, w, group))[starts + counts - 1]
+    w = w[order]
+    wsum = np.add.reduceat(w, starts)
+
+    carried = [c for c in ("player", "team", "pos", "opp") if c in df and c not in keys]
+    out = df.iloc[shown][keys + carried].reset_index(drop=True)
+    mean = np.add.reduceat(w * x, starts) / wsum
+    out["consensus"] = mean
+    out["std"] = np.sqrt(np.add.reduceat(w * (x - np.repeat(mean, counts)) ** 2, starts) / wsum)
+    for name, q in quantiles.items():
+        # Linear interpolation between order statistics, as in Series.quantile
+        at = starts + q * (counts - 1)
+        lo = np.floor(at).astype(int)
+        hi = np.ceil(at).astype(int)
+        out[name] = x[lo] + (x[hi] - x[lo]) * (at - lo)
+    source_codes = pd.factorize(source.to_numpy()[order])[0]
+    out["sources"] = np.bincount(np.unique(g * (source_codes.max() + 1) + source_codes) // (source_codes.max() + 1))
+    for col in mean_columns:
+        out[col] = np.add.reduceat(w * df[col].to_numpy(dtype=float)[order], starts) / wsum
+    if "timestamp" in df:
+        out["timestamp"] = np.maximum.reduceat(stamps[order], starts).view("datetime64[us]")
 
-        # Consensus: mean across sources (here simplified to per-player avg)
-        consensus = df.groupby(['player', 'team', 'pos']).agg({
-            'source_points': 'mean',
-            'opp_pts': 'mean'  # For def
-        }).reset_index()
-        consensus.rename(columns={'source_points': 'consensus'}, inplace=True)
-        consensus['floor'] = df.groupby(['player', 'pos'])['source_points'].quantile(0.1).reindex(consensus.index, method='ffill').values
-        consensus['ceiling'] = df.groupby(['player', 'pos'])['source_points'].quantile(0.9).reindex(consensus.index, method='ffill').values
-        consensus = consensus.sort_values('consensus', ascending=False)
-        consensus['overall_rank'] = consensus['consensus'].rank(ascending=False).astype(int)
-        consensus['pos_rank'] = consensus.groupby('pos')['consensus'].rank(ascending=False).astype(int)
-
-        self.finished.emit(consensus)
-
-# ============================= GUI =============================
-class MainWindow(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Your Custom League Consensus Projections (2025)")
-        self.setGeometry(100, 50, 1400, 900)
-        self.setStyleSheet("""
-            QMainWindow { background: #0f1620; color: #e0e0e0; }
-            QLabel { color: #e0e0e0; font-size: 11pt; }
-            QTableView { background: #1a2332; gridline-color: #333; font-size: 10pt; }
-            QPushButton { background: #00bfff; color: black; font-weight: bold; padding: 10px; border-radius: 5px; }
-            QComboBox { background: #1a2332; color: #e0e0e0; padding: 5px; }
-        """)
-
-        central = QWidget()
-        layout = QVBoxLayout()
-
-        title = QLabel("<h1 style='color:#00bfff'>Your League Custom Scoring Consensus</h1>")
-        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(title)
-
-        controls = QHBoxLayout()
-        QLabel("Position:").setStyleSheet("color:#888;")
-        self.pos_filter = QComboBox()
-        self.pos_filter.addItems(["ALL", "QB", "RB", "WR", "TE", "K", "DST"])
-        self.pos_filter.currentTextChanged.connect(self.filter_pos)
-        controls.addWidget(self.pos_filter)
-
-        self.update_btn = QPushButton("🔄 Update Projections (Live Scrape)")
-        self.update_btn.clicked.connect(self.start_update)
-        controls.addWidget(self.update_btn)
-
-        self.cache_btn = QPushButton("📁 Load from Cache (Fast)")
-        self.cache_btn.clicked.connect(self.load_cache)
-        controls.addWidget(self.cache_btn)
-        controls.addStretch()
-        layout.addLayout(controls)
-
-        self.progress = QProgressBar()
-        self.progress.setVisible(False)
-        layout.addWidget(self.progress)
-
-        self.status = QLabel("Ready—Try 'Load from Cache' for instant view or Update for fresh data.")
-        layout.addWidget(self.status)
-
-        # Table like FantasyPros
-        self.model = QStandardItemModel()
-        self.model.setHorizontalHeaderLabels(["Overall Rank", "Pos Rank", "Player", "Team", "Pos", "Opp", "Consensus Pts", "Floor", "Ceiling"])
-        self.proxy = QSortFilterProxyModel()
-        self.proxy.setSourceModel(self.model)
-        self.table = QTableView()
-        self.table.setModel(self.proxy)
-        self.table.setSortingEnabled(True)
-        self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.setAlternatingRowColors(True)
-        layout.addWidget(self.table, 1)
-
-        central.setLayout(layout)
-        self.setCentralWidget(central)
-        self.full_df = pd.DataFrame()
-        self.load_cache()  # Auto-load cache on start
-
-    def start_update(self):
-        self.update_btn.setEnabled(False)
-        self.cache_btn.setEnabled(False)
-        self.progress.setVisible(True)
-        self.progress.setValue(0)
-        self.status.setText("Live scraping... (45-90 sec)")
-        self.thread = ScrapeThread()
-        self.thread.progress.connect(self.update_progress)
-        self.thread.finished.connect(self.display_results)
-        self.thread.start()
-
-    def update_progress(self, msg):
-        self.status.setText(msg)
-        self.progress.setValue(self.progress.value() + 10)  # Simple progress
-
-    def load_cache(self):
-        df = load_cache()
-        if not df.empty:
-            self.display_results(df)
-            self.status.setText("Loaded from cache—last updated unknown. Click Update for fresh.")
+    out = out.sort_values("consensus", ascending=False, ignore_index=True)
+    if "week" in keys:
+        # Each week is ranked on its own, weeks kept in the order they were scraped
+        weeks = pd.Categorical(out["week"], categories=pd.unique(df["week"].dropna()))
+        out = out.iloc[np.argsort(weeks.codes, kind="stable")].reset_index(drop=True)
+        out["overall_rank"] = out.groupby("week", sort=False, dropna=False).cumcount() + 1
+        out["pos_rank"] = out.groupby(["week", "pos"], sort=False, dropna=False).cumcount() + 1
+    else:
+        out["overall_rank"] = np.arange(1, len(out) + 1)
+        out["pos_rank"] = out.groupby("pos").cumcount() + 1
+    return out
+
+def _ranking_keys(df):
+    """One consensus row per player, or per player and week when rows carry a week."""
+    return ["player_id", "week"] if "week" in df else ["player_id"]
+
+def build_rankings(df, resolver=None, draws=0, workers=None, report=None, **consensus_options):
+    """Resolve player identities across sources, then compute the consensus per player.
+
+    With draws, floor/ceiling come from simulate_outcomes instead of the source
+    quantiles and boom/bust probabilities are added; df then needs its stat columns.
+    Each step is timed as a span on report. Several weeks give one row per player
+    per week, each week ranked separately.
+    """
+    report = RunReport() if report is None else report
+    with report.span("resolve_players"):
+        df = resolve_players(df, resolver)
+    keys = _ranking_keys(df)
+    with report.span("consensus"):
+        rankings = compute_consensus(df, keys=keys, **consensus_options)
+    if draws:
+        with report.span("simulate"):
+            sim = simulate_outcomes(df, draws, workers, keys=keys).reindex(rankings.set_index(keys).index)
+        for col in sim:
+            rankings[col] = sim[col].to_numpy()
+    return rankings
+
+# ============================= SCORING PROFILES =============================
+PROFILES_DIR = 'scoring_profiles'
+
+def load_scoring_profiles(path=PROFILES_DIR):
+    """League scoring profiles from <path>/*.json, plus "default" (CUSTOM_SCORING).
+
+    Each file is a scoring dict keyed like CUSTOM_SCORING and named after the file;
+    keys it leaves out fall back to CUSTOM_SCORING, so it only lists the rules that differ.
+    Every key must be a CUSTOM_SCORING key or a yardage bonus / DST tier like the ones
+    there, with a numeric value; anything else (usually a typo that would silently
+    score nothing) raises ValueError naming the file and the key.
+    """
+    profiles = {"default": CUSTOM_SCORING}
+    if path and os.path.isdir(path):
+        for fname in sorted(os.listdir(path)):
+            if fname.endswith(".json"):
+                fpath = os.path.join(path, fname)
+                with open(fpath) as f:
+                    scoring = json.load(f)
+                if not isinstance(scoring, dict):
+                    raise ValueError(f"{fpath}: expected a JSON object of scoring rules")
+                for key, value in scoring.items():
+                    if key not in CUSTOM_SCORING and not (_BONUS_KEY.match(key) or _TIER_KEY.match(key)):
+                        raise ValueError(f"{fpath}: unknown scoring key {key!r}")
+                    if isinstance(value, bool) or not isinstance(value, (int, float)):
+                        raise ValueError(f"{fpath}: scoring key {key!r} needs a number, got {value!r}")
+                profiles[os.path.splitext(fname)[0]] = {**CUSTOM_SCORING, **scoring}
+    return profiles
+
+def build_profile_rankings(df, profiles, resolver=None, **consensus_options):
+    """build_rankings plus consensus_<profile> and rank_<profile> columns for every profile.
+
+    Every row is scored against all profiles in one ScoringEngine pass and the
+    per-profile means ride along in the same consensus pass as the default points.
+    """
+    engine = ScoringEngine(profiles=profiles)
+    points = engine.score_profiles(df)
+    df = resolve_players(df.join(points), resolver)
+    keys = _ranking_keys(df)
+    mean_columns = ["opp_pts"] + list(points.columns)
+    rankings = compute_consensus(df, keys=keys, mean_columns=mean_columns, **consensus_options)
+    for name in engine.profiles:
+        col = f"consensus_{name}"
+        rankings[col] = rankings.pop(f"pts_{name}").round(2)
+        ranked = rankings.groupby("week", sort=False)[col] if "week" in keys else rankings[col]
+        rankings[f"rank_{name}"] = ranked.rank(ascending=False, method="first").astype(int)
+    return rankings
+
+# ============================= SIMULATION =============================
+SIMULATION_DRAWS = 10000
+SIMULATION_CHUNK_CELLS = 4_000_000  # Stat cells (players x draws x stats) sampled per batch
+SIMULATION_SEED = 0  # Fixed, so the same projections always get the same floor/ceiling
+BOOM_BUST = (1.25, 0.75)  # Boom: at least 125% of the projection; bust: at most 75%
+# Baseline coefficient of variation per stat, on top of the spread between sources.
+# Exact names win over prefixes; anything unmatched uses "default".
+VARIANCE_MODEL = {
+    "default": 0.4,
+    "pass_cmp": 0.15, "pass_att": 0.15, "pass_yds": 0.25, "pass_td": 0.5, "int": 0.7,
+    "rush_att": 0.3, "rush_yds": 0.4, "rush_td": 0.8,
+    "rec": 0.35, "rec_yds": 0.45, "rec_td": 0.9,
+    "fg_": 0.6, "xp_": 0.4, "def_": 0.6, "opp_pts": 0.35, "opp_yds": 0.2,
+}
+
+def _stat_cv(stat, model=VARIANCE_MODEL):
+    if stat in model:
+        return model[stat]
+    prefixes = [k for k in model if k.endswith("_") and stat.startswith(k)]
+    return model[max(prefixes, key=len)] if prefixes else model["default"]
+
+def _simulate_chunk(engine, cols, mean, sd, is_def, draws, seed):
+    """Sample draws stat lines for each player in a batch and score them all at once.
+
+    Stats are Gamma-distributed with the given mean/sd (non-negative and right-skewed,
+    like touchdowns), independently per stat. Returns floor, ceiling, boom and bust arrays.
+    """
+    rng = np.random.default_rng(seed)
+    m, k = mean.shape
+    var = sd ** 2
+    shape = np.divide(mean ** 2, var, out=np.zeros_like(mean), where=var > 0)
+    scale = np.divide(var, mean, out=np.zeros_like(mean), where=mean > 0)
+    samples = rng.gamma(shape[:, None, :], scale[:, None, :], size=(m, draws, k))
+    samples = np.where((var > 0)[:, None, :], samples, mean[:, None, :])
+
+    X = np.zeros((m * draws, len(engine.columns)))
+    X[:, cols] = samples.reshape(m * draws, k)
+    pts = engine.score_matrix(X, np.repeat(is_def, draws)).reshape(m, draws)
+    expected = np.zeros((m, len(engine.columns)))
+    expected[:, cols] = mean
+    expected = engine.score_matrix(expected, is_def)[:, None]
+    floor, ceiling = np.quantile(pts, [CONSENSUS_QUANTILES["floor"], CONSENSUS_QUANTILES["ceiling"]], axis=1)
+    boom = (pts >= BOOM_BUST[0] * expected).mean(axis=1)
+    bust = (pts <= BOOM_BUST[1] * expected).mean(axis=1)
+    return floor, ceiling, boom, bust
+
+def simulate_outcomes(df, draws=SIMULATION_DRAWS, workers=None, seed=SIMULATION_SEED, engine=None, keys=("player_id",)):
+    """Monte Carlo floor/ceiling and boom/bust probabilities per player_id (or per keys).
+
+    Each stat's mean is the player's average across sources and its spread combines
+    the between-source std with VARIANCE_MODEL, so single-source players still get a
+    real range. Players are batched by position (dropping stats nobody at that position
+    has) under SIMULATION_CHUNK_CELLS; batches run in a process pool when workers > 1.
+    Players are taken in key order, so with a given seed the result does not depend on
+    the order of df's rows (a fresh scrape and the cache give the same numbers).
+    """
+    engine = SCORING_ENGINE if engine is None else engine
+    stats = [c for c in engine.columns if c in df]
+    grouped = df.groupby(list(keys), sort=True)
+    means = grouped[stats].mean().fillna(0)
+    spread = grouped[stats].std(ddof=0).fillna(0)
+    cv = np.array([_stat_cv(c) for c in stats])
+    sds = np.sqrt(spread ** 2 + (means * cv) ** 2)
+    is_def = grouped["pos"].first().eq("DST").reindex(means.index).to_numpy()
+    pos = grouped["pos"].first().reindex(means.index).to_numpy()
+
+    tasks, order = [], []
+    for p in pd.unique(pos):
+        rows = np.flatnonzero(pos == p)
+        used = np.flatnonzero(means.to_numpy()[rows].any(axis=0) | sds.to_numpy()[rows].any(axis=0))
+        cols = np.array([engine.columns.index(stats[i]) for i in used], dtype=int)
+        per_batch = max(1, SIMULATION_CHUNK_CELLS // (draws * len(engine.columns)))
+        for start in range(0, len(rows), per_batch):
+            batch = rows[start:start + per_batch]
+            tasks.append((engine, cols, means.to_numpy()[np.ix_(batch, used)], sds.to_numpy()[np.ix_(batch, used)],
+                          is_def[batch], draws))
+            order.append(batch)
+    seeds = np.random.SeedSequence(seed).spawn(len(tasks))
+    if workers and workers > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_simulate_chunk, *zip(*tasks), seeds,
+                                    chunksize=max(1, len(tasks) // (workers * 4))))
+    else:
+        results = [_simulate_chunk(*task, seed) for task, seed in zip(tasks, seeds)]
+
+    out = np.zeros((len(means), 4))
+    for batch, result in zip(order, results):
+        out[batch] = np.column_stack(result)
+    return pd.DataFrame(out.round(3), index=means.index, columns=["floor", "ceiling", "boom", "bust"])
+
+# ============================= HEADLESS / CLI =============================
+EXPORT_COLUMNS = ["week", "overall_rank", "pos_rank", "player", "team", "pos", "opp",
+                  "consensus", "floor", "ceiling", "boom", "bust", "std", "sources", "timestamp"]
+EXPORT_FORMATS = ("csv", "json", "xlsx")
+
+def export_rankings(rankings, path, fmt):
+    """Write rankings as csv, json (records) or xlsx; path "-" means stdout for text formats."""
+    profile_columns = [c for c in rankings if c.startswith(("consensus_", "rank_"))]
+    rankings = rankings[[c for c in EXPORT_COLUMNS if c in rankings] + profile_columns]
+    target = sys.stdout if path == "-" else path
+    if fmt == "csv":
+        rankings.to_csv(target, index=False, float_format="%.2f")
+    elif fmt == "json":
+        rankings.to_json(target, orient="records", date_format="iso", double_precision=2, indent=1)
+    else:
+        rankings.to_excel(path, index=False, engine="openpyxl")
+
+def run_headless(args):
+    """Scrape (or read the cache), score, build consensus and export - no GUI modules loaded."""
+    cold_start = time.perf_counter() - _STARTED
+    report = RunReport()
+    # Checked before scraping so a bad output name or a typo in a profile doesn't cost a whole update
+    fmt = args.format or os.path.splitext(args.output)[1].lstrip(".").lower() or "csv"
+    if fmt not in EXPORT_FORMATS or (fmt == "xlsx" and args.output == "-"):
+        print(f"Can't write {fmt!r} to {args.output}; use one of {', '.join(EXPORT_FORMATS)} (xlsx needs a file)", file=sys.stderr)
+        return 2
+    try:
+        profiles = load_scoring_profiles(args.profiles) if args.profiles else None
+    except ValueError as e:
+        print(f"Bad scoring profile: {e}", file=sys.stderr)
+        return 2
+    if args.from_cache:
+        # Profiles and simulation work from the raw stats, so they need every column
+        df = load_cache(columns=None if args.profiles or args.simulate else DISPLAY_COLUMNS)
+    else:
+        fetch_cache = FetchCache()
+        df = asyncio.run(scrape_sources(weeks=args.weeks, fetch_cache=fetch_cache, report=report))
+        print(f"{fetch_cache.summary()} | {report.summary()} | report: {report.save()}", file=sys.stderr)
+    if df.empty:
+        print("No data—check internet or run without --from-cache first!", file=sys.stderr)
+        return 1
+
+    if args.profiles:
+        rankings = build_profile_rankings(df, profiles)
+        if args.simulate:
+            resolved = resolve_players(df)
+            keys = _ranking_keys(resolved)
+            sim = simulate_outcomes(resolved, args.simulate, args.workers, keys=keys)
+            sim = sim.reindex(rankings.set_index(keys).index)
+            rankings[list(sim)] = sim.to_numpy()
+    else:
+        rankings = build_rankings(df, draws=args.simulate, workers=args.workers, report=report)
+    if args.pos != "ALL":
+        rankings = rankings[rankings["pos"] == args.pos]
+    if args.top:
+        rankings = rankings.head(args.top)
+    export_rankings(rankings, args.output, fmt)
+    print(f"{len(rankings)} players -> {args.output} | cold start {cold_start * 1000:.0f} ms, "
+          f"total {(time.perf_counter() - _STARTED) * 1000:.0f} ms", file=sys.stderr)
+    return 0
+
+# ============================= RANKINGS SERVER =============================
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8765
+SERVER_REFRESH_MINUTES = 60
+SERVER_MAX_LIMIT = 500  # Most players one /rankings response returns
+SERVER_IDLE_TIMEOUT = 15  # Seconds a keep-alive connection may sit between requests
+
+class RankingsIndex:
+    """Consensus table pre-serialized for serving.
+
+    Every player is encoded to JSON once, in overall-rank order, and each (week,
+    position) keeps its own list (already in pos-rank order), so answering a query
+    is a list slice plus a join; nothing touches pandas or disk per request.
+    """
+
+    def __init__(self, rankings=None, updated=None):
+        rankings = pd.DataFrame(columns=EXPORT_COLUMNS) if rankings is None else rankings
+        rankings = rankings.sort_values("overall_rank", kind="stable")
+        records = json.loads(rankings[[c for c in EXPORT_COLUMNS if c in rankings]].to_json(
+            orient="records", date_format="iso", double_precision=2))
+        weeks = rankings["week"].astype(str) if "week" in rankings else pd.Series("", index=rankings.index)
+        self.weeks = list(pd.unique(weeks))  # The first is served when a query names no week
+        self.rows = {}
+        for record, week, pos in zip(records, weeks, rankings["pos"]):
+            blob = json.dumps(record, separators=(",", ":")).encode()
+            self.rows.setdefault((week, "ALL"), []).append(blob)
+            self.rows.setdefault((week, pos), []).append(blob)
+        self.updated = (updated or datetime.now()).isoformat(timespec="seconds")
+
+    def query(self, pos="ALL", offset=0, limit=50, week=None):
+        week = (self.weeks[0] if self.weeks else "") if week is None else week
+        rows = self.rows.get((week, pos), [])
+        page = rows[offset:offset + limit]
+        head = (f'{{"updated":"{self.updated}","week":{json.dumps(week)},"pos":{json.dumps(pos)},'
+                f'"total":{len(rows)},"offset":{offset},"players":[')
+        return head.encode() + b",".join(page) + b"]}"
+
+class RankingsServer:
+    """Small keep-alive HTTP/1.1 JSON server over a RankingsIndex held in memory.
+
+    GET /rankings?pos=WR&week=3&limit=30&offset=0 and GET /health; without week= the
+    first of weeks is served. The index is rebuilt on a schedule (scraping, or
+    re-reading the snapshot store when from_cache) in a worker thread and swapped in
+    whole, so requests never wait on a refresh. Connections idle for idle_timeout
+    seconds are closed.
+    """
+
+    def __init__(self, host=SERVER_HOST, port=SERVER_PORT, refresh_minutes=SERVER_REFRESH_MINUTES,
+                 weeks=("draft",), from_cache=False, idle_timeout=SERVER_IDLE_TIMEOUT):
+        self.host, self.port = host, port
+        self.refresh_seconds = refresh_minutes * 60
+        self.weeks = weeks
+        self.from_cache = from_cache
+        self.idle_timeout = idle_timeout
+        self.fetch_cache = FetchCache()
+        self.session = None  # Opened by the first scraping refresh and kept for every later one
+        self.index = RankingsIndex()
+        self.requests = 0
+
+    def _rebuild(self):
+        """Scrape (or read the cache) and build a new index, or None if there was no data.
+
+        Blocking from end to end: parsing, the fetch cache and snapshot writes and the
+        consensus all run here, on the session's loop or this thread, never the serving loop.
+        """
+        report = RunReport()
+        if self.from_cache:
+            df = load_cache()  # Stat columns too: the refresh runs off the serving loop, so it can simulate
         else:
-            self.status.setText("No cache found—run Update first!")
-
-    def display_results(self, df):
-        self.full_df = df
-        self.filter_pos(self.pos_filter.currentText())
-        self.update_btn.setEnabled(True)
-        self.cache_btn.setEnabled(True)
-        self.progress.setVisible(False)
-        self.progress.setValue(100)
-        timestamp = df.get('timestamp', datetime.now()).iloc[0] if not df.empty else datetime.now()
-        self.status.setText(f"Loaded {len(df)} projections | Updated: {timestamp.strftime('%b %d, %Y %I:%M %p')}")
-
-    def filter_pos(self, pos):
-        self.model.removeRows(0, self.model.rowCount())
-        data = self.full_df if pos == "ALL" else self.full_df[self.full_df['pos'] == pos]
-        for _, row in data.iterrows():
-            items = [
-                QStandardItem(str(int(row.get('overall_rank', '')))),
-                QStandardItem(str(int(row.get('pos_rank', '')))),
-                QStandardItem(row['player']),
-                QStandardItem(row['team']),
-                QStandardItem(row['pos']),
-                QStandardItem(row['opp']),
-                QStandardItem(f"{row['consensus']:.1f}"),
-                QStandardItem(f"{row['floor']:.1f}" if pd.notna(row['floor']) else "—"),
-                QStandardItem(f"{row['ceiling']:.1f}" if pd.notna(row['ceiling']) else "—"),
-            ]
-            for it in items:
-                it.setEditable(False)
-                if row['pos'] == 'DST': it.setForeground(QColor(0, 255, 0))  # Green for DST
-            self.model.appendRow(items)
+            if self.session is None:
+                self.session = BrowserSession()
+            df = self.session.scrape(weeks=self.weeks, fetch_cache=self.fetch_cache, report=report)
+        if df.empty:
+            print(f"Refresh found no data; keeping the current rankings | {report.summary()}", file=sys.stderr)
+            return None
+        rankings = build_rankings(df, draws=SIMULATION_DRAWS, report=report)
+        index = RankingsIndex(rankings, df["timestamp"].max() if "timestamp" in df else None)
+        path = report.save() if not self.from_cache else None
+        print(f"Rankings refreshed: {len(rankings)} players | {report.summary()}"
+              + (f" | report: {path}" if path else ""), file=sys.stderr)
+        return index
+
+    async def refresh(self):
+        index = await asyncio.get_running_loop().run_in_executor(None, self._rebuild)
+        if index is not None:
+            self.index = index
+
+    async def _refresh_forever(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                print(f"Refresh failed: {e!r}", file=sys.stderr)
+            await asyncio.sleep(self.refresh_seconds)
+
+    def _route(self, target):
+        path, _, qs = target.partition("?")
+        if path == "/health":
+            return 200, f'{{"ok":true,"updated":"{self.index.updated}","requests":{self.requests}}}'.encode()
+        if path != "/rankings":
+            return 404, b'{"error":"not found"}'
+        params = {name: values[-1] for name, values in urllib.parse.parse_qs(qs).items()}
+        try:
+            offset = max(0, int(params.get("offset", 0)))
+            limit = min(SERVER_MAX_LIMIT, max(0, int(params.get("limit", 50))))
+        except ValueError:
+            return 400, b'{"error":"offset and limit must be integers"}'
+        return 200, self.index.query(params.get("pos", "ALL").upper(), offset, limit, params.get("week"))
+
+    async def _handle(self, reader, writer):
+        def readline():
+            return asyncio.wait_for(reader.readline(), self.idle_timeout)
+        try:
+            while True:
+                request_line = await readline()
+                if not request_line:
+                    break
+                method, target, version = (request_line.decode("latin-1").split() + ["", "", ""])[:3]
+                keep_alive = version == "HTTP/1.1"
+                while True:
+                    line = await readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    if name.strip().lower() == "connection":
+                        keep_alive = value.strip().lower() == "keep-alive" or (keep_alive and value.strip().lower() != "close")
+                self.requests += 1
+                status, body = (405, b'{"error":"GET only"}') if method != "GET" else self._route(target)
+                reason = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}[status]
+                writer.write(f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json\r\n"
+                             f"Content-Length: {len(body)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode()
+                             + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve_forever(self):
+        server = await asyncio.start_server(self._handle, self.host, self.port, backlog=1024)
+        print(f"Serving rankings on http://{self.host}:{self.port}/rankings", file=sys.stderr)
+        refresher = asyncio.create_task(self._refresh_forever())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            refresher.cancel()
+            if self.session is not None:
+                # One HTTP client and (once needed) one browser served every refresh
+                await asyncio.get_running_loop().run_in_executor(None, self.session.close)
+
+def main(argv=None):
+    multiprocessing.freeze_support()  # Lets the frozen .exe start as a --workers simulation process
+    parser = argparse.ArgumentParser(description="Custom-scoring fantasy consensus projections. "
+                                                 "Opens the GUI unless --headless or --serve is given.")
+    parser.add_argument("--headless", action="store_true", help="scrape, score, build consensus and export without the GUI")
+    parser.add_argument("--from-cache", action="store_true", help="use the latest stored snapshots instead of scraping")
+    parser.add_argument("--weeks", nargs="+", default=["draft"], help='weeks to scrape (default: "draft")')
+    parser.add_argument("--pos", default="ALL", choices=["ALL"] + POSITIONS, help="only export one position")
+    parser.add_argument("--top", type=int, default=0, help="only export the top N players")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, help="output format (default: from --output extension, else csv)")
+    parser.add_argument("--profiles", metavar="DIR", help="also score against every league profile in DIR/*.json")
+    parser.add_argument("--simulate", type=int, nargs="?", const=SIMULATION_DRAWS, default=0, metavar="DRAWS",
+                        help=f"Monte Carlo floor/ceiling/boom/bust like the GUI's (default draws: {SIMULATION_DRAWS}; "
+                             "without it, floor/ceiling are the spread between sources)")
+    parser.add_argument("--workers", type=int, default=None, help="processes for --simulate (default: 1)")
+    parser.add_argument("-o", "--output", default="-", help='output file, or "-" for stdout (default)')
+    parser.add_argument("--serve", action="store_true", help="serve rankings as JSON over HTTP, refreshing on a schedule")
+    parser.add_argument("--host", default=SERVER_HOST, help=f"--serve address (default: {SERVER_HOST})")
+    parser.add_argument("--port", type=int, default=SERVER_PORT, help=f"--serve port (default: {SERVER_PORT})")
+    parser.add_argument("--refresh-minutes", type=float, default=SERVER_REFRESH_MINUTES,
+                        help=f"--serve refresh interval (default: {SERVER_REFRESH_MINUTES})")
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        server = RankingsServer(args.host, args.port, args.refresh_minutes, args.weeks, args.from_cache)
+        try:
+            asyncio.run(server.serve_forever())
+        except KeyboardInterrupt:
+            pass
+        return 0
+    if args.headless:
+        return run_headless(args)
+    # The GUI module imports this one by name; reuse the already-running copy
+    sys.modules.setdefault("YourLeagueConsensus", sys.modules[__name__])
+    from consensus_gui import run_gui
+    return run_gui()
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    app.setStyle("Fusion")
-    window = MainWindow()
-    window.show()
-    sys.exit(app.exec())
+    sys.exit(main())
@@ -0,0 +1,283 @@
+# bench_pipeline.py
+# Timing for every pipeline stage on deterministic synthetic data - results as JSON
+#
+#   python benchmarks/bench_pipeline.py                       # 1k / 10k / 100k rows
+#   python benchmarks/bench_pipeline.py --sizes 1000 1000000 -o bench.json
+#   python benchmarks/bench_pipeline.py --write-fixtures      # regenerate fixtures/*.html
+#   python benchmarks/bench_pipeline.py --record-fixtures     # save the live pages to fixtures/recorded/
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import platform
+import tempfile
+import threading
+import functools
+import subprocess
+import http.server
+import numpy as np
+import pandas as pd
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FIXTURES = os.path.join(HERE, "fixtures")
+RECORDED = os.path.join(FIXTURES, "recorded")  # Real pages saved by --record-fixtures
+sys.path.insert(0, os.path.dirname(HERE))
+import YourLeagueConsensus as ylc
+
+TEAMS = ["ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE", "DAL", "DEN", "DET", "GB", "HOU", "IND", "JAC", "KC",
+         "LAC", "LAR", "LV", "MIA", "MIN", "NE", "NO", "NYG", "NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN", "WAS"]
+SYLLABLES = ["ka", "lo", "mi", "ren", "tor", "vas", "zel", "qui", "bra", "dun",
+             "pe", "sho", "gar", "wil", "mon", "te", "har", "jo", "ne", "fi"]
+# Share of the player pool at each position (roughly a draft board)
+POSITION_MIX = {"QB": 0.12, "RB": 0.25, "WR": 0.33, "TE": 0.14, "K": 0.08, "DST": 0.08}
+# Mean projection per stat by position; sources and players scatter around these
+STAT_MEANS = {
+    "QB": {"pass_cmp": 22, "pass_att": 34, "pass_yds": 250, "pass_td": 1.7, "int": 0.7, "rush_att": 4,
+           "rush_yds": 20, "rush_td": 0.2, "fumble_lost": 0.2, "pass_fd": 12, "sacks_taken": 2},
+    "RB": {"rush_att": 14, "rush_yds": 62, "rush_td": 0.5, "rec": 2.8, "rec_yds": 22, "rec_td": 0.1,
+           "fumble_lost": 0.1, "rush_fd": 3.5, "rec_fd": 1.1},
+    "WR": {"rush_att": 0.3, "rush_yds": 2, "rec": 5, "rec_yds": 62, "rec_td": 0.4, "fumble_lost": 0.05, "rec_fd": 3},
+    "TE": {"rec": 3.8, "rec_yds": 40, "rec_td": 0.3, "fumble_lost": 0.05, "rec_fd": 2},
+    "K": {"fg_0_19": 0.05, "fg_20_29": 0.5, "fg_30_39": 0.5, "fg_40_49": 0.45, "fg_50_plus": 0.25, "xp_made": 2.3},
+    "DST": {"def_sacks": 2.5, "def_int": 0.8, "def_fum_rec": 0.6, "def_td": 0.15, "opp_pts": 21, "opp_yds": 330,
+            "def_4th_down_stops": 1},
+}
+
+
+# ============================= SYNTHETIC DATA =============================
+def synthetic_projections(rows, sources=4, seed=0):
+    """Deterministic per-source projection rows shaped like scrape_sources output.
+
+    rows // sources players each get one row per source; every source scatters its
+    stats around the player's own baseline, so consensus, spread and ranks are all
+    non-trivial. A small share of names is respelled per source to exercise identity
+    resolution.
+    """
+    rng = np.random.default_rng(seed)
+    players = max(1, rows // sources)
+    first = [_synthetic_name(i * 7 + 3).title() for i in range(players)]
+    last = [_synthetic_name(i).title() + "son" for i in range(players)]
+    pos = rng.choice(list(POSITION_MIX), size=players, p=list(POSITION_MIX.values()))
+    talent = rng.lognormal(0, 0.35, size=players)
+    frames = []
+    for s in range(sources):
+        df = pd.DataFrame({
+            "player": [f"{f} {l}" for f, l in zip(first, last)],
+            "team": rng.choice(TEAMS, size=players) if s == 0 else None,
+            "pos": pos, "opp": "vs BUF", "source": f"Source{s}", "week": "draft",
+        })
+        stats = np.zeros((players, len(ylc.STAT_COLUMNS)))
+        for p, means in STAT_MEANS.items():
+            mask = pos == p
+            for stat, mean in means.items():
+                col = ylc.STAT_COLUMNS.index(stat)
+                scale = 1.0 if stat.startswith("opp_") else talent[mask]
+                stats[mask, col] = np.round(mean * scale * rng.normal(1, 0.1, mask.sum()).clip(0.3), 1)
+        df[ylc.STAT_COLUMNS] = stats
+        if s:
+            respelled = rng.random(players) < 0.05
+            df.loc[respelled, "player"] = [f"{first[i][0]}. {last[i]} Jr." for i in np.flatnonzero(respelled)]
+        frames.append(df)
+    df = pd.concat(frames, ignore_index=True)
+    df["team"] = df["team"].fillna(pd.Series(np.tile(frames[0]["team"].to_numpy(), sources)))
+    df = df.head(rows).copy()
+    df["source_points"] = ylc.SCORING_ENGINE.score(df)
+    df["timestamp"] = pd.Timestamp("2025-12-01 12:00:00")
+    return df
+
+def _synthetic_name(i):
+    """Distinct pronounceable name for every i (least significant syllable first)."""
+    parts = []
+    while True:
+        parts.append(SYLLABLES[i % len(SYLLABLES)])
+        i //= len(SYLLABLES)
+        if not i:
+            return "".join(parts) if len(parts) > 1 else parts[0] + "la"
+
+def fantasypros_html(pos, rows=60, seed=0):
+    """A FantasyPros-style projections page for one position (the layout ROW_XPATH targets)."""
+    rng = np.random.default_rng(seed)
+    body = []
+    for i in range(rows):
+        team = TEAMS[i % len(TEAMS)]
+        name = f"{team} Defense" if pos == "DST" else f"{_synthetic_name(i * 7 + 3).title()} {_synthetic_name(i).title()}son"
+        stats = " ".join(f"<td>{v:,.1f}</td>" for v in rng.uniform(0, 300 if pos == "QB" else 80, 12))
+        body.append(f'<tr class="mpb-player-{i}"><td class="player-label"><a href="#" class="player-name">{name}</a> '
+                    f'<small class="grey">{team}</small></td><td>{i + 1}</td><td>{rng.integers(5, 15)}</td>'
+                    f'<td>vs {TEAMS[(i + 7) % len(TEAMS)]}</td>{stats}</tr>')
+    return (f'<!DOCTYPE html><html><head><title>{pos} Projections</title></head><body>'
+            f'<div class="mobile-table"><table id="data" class="table table-player-table">'
+            f'<thead><tr><th>Player</th><th>Rank</th><th>Bye</th><th>Opp</th>{"<th>Stat</th>" * 12}</tr></thead>'
+            f'<tbody>\n' + "\n".join(body) + '\n</tbody></table></div></body></html>\n')
+
+def write_fixtures(path=FIXTURES):
+    os.makedirs(path, exist_ok=True)
+    for i, pos in enumerate(ylc.POSITIONS):
+        with open(os.path.join(path, f"{pos.lower()}.html"), "w") as f:
+            f.write(fantasypros_html(pos, seed=i))
+
+def record_fixtures(path=RECORDED):
+    """Save the live FantasyPros pages, so parser drift against the real layout shows up offline."""
+    async def fetch_all():
+        async with ylc.HttpFetcher() as http:
+            return await asyncio.gather(*(http.fetch(ylc.FANTASYPROS_URL.format(pos=pos.lower(), week="draft"))
+                                          for pos in ylc.POSITIONS))
+    os.makedirs(path, exist_ok=True)
+    for pos, (html, _, _) in zip(ylc.POSITIONS, asyncio.run(fetch_all())):
+        with open(os.path.join(path, f"{pos.lower()}.html"), "w", encoding="utf-8") as f:
+            f.write(html)
+        print(f"{pos}: {len(ylc.parse_projection_table(html, pos))} rows parsed", file=sys.stderr)
+
+def load_fixtures(path=FIXTURES):
+    fixtures = {}
+    for pos in ylc.POSITIONS:
+        with open(os.path.join(path, f"{pos.lower()}.html")) as f:
+            fixtures[pos] = f.read()
+    return fixtures
+
+
+# ============================= TIMING =============================
+def timed(fn, repeat):
+    """(best, mean) wall seconds of fn() over repeat runs."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times), sum(times) / len(times)
+
+def record(results, stage, rows, fn, repeat):
+    best, mean = timed(fn, repeat)
+    results.append({"stage": stage, "rows": rows, "repeat": repeat, "best_s": round(best, 6),
+                    "mean_s": round(mean, 6), "rows_per_s": round(rows / best) if best > 0 else None})
+    print(f"{stage:<32} {rows:>9,} rows  best {best * 1000:10.2f} ms", file=sys.stderr)
+
+def bench_scoring(results, df, repeat):
+    # The per-row wrapper is timed on at most 10k rows; it exists for single dicts, not tables
+    sample = df.head(10_000).to_dict("records")
+    record(results, "calculate_fantasy_points", len(sample),
+           lambda: [ylc.calculate_fantasy_points(r, r["pos"] == "DST") for r in sample], 1)
+    record(results, "ScoringEngine.score", len(df), lambda: ylc.SCORING_ENGINE.score(df), repeat)
+    profiles = {f"league{i}": {**ylc.CUSTOM_SCORING, "rec": i / 20} for i in range(20)}
+    engine = ylc.ScoringEngine(profiles=profiles)
+    record(results, "ScoringEngine.score_profiles[20]", len(df), lambda: engine.score_profiles(df), repeat)
+
+def bench_parsing(results, fixtures, repeat):
+    for pos, html in fixtures.items():
+        rows = len(ylc.parse_projection_table(html, pos))
+        record(results, f"parse_projection_table[{pos}]", rows, lambda: ylc.parse_projection_table(html, pos), repeat)
+
+def bench_consensus(results, df, repeat):
+    record(results, "compute_consensus", len(df), lambda: ylc.compute_consensus(df), repeat)
+    record(results, "build_rankings", len(df), lambda: ylc.build_rankings(df, ylc.PlayerResolver(path=None)), repeat)
+
+def bench_cache(results, df, repeat):
+    with tempfile.TemporaryDirectory() as root:
+        store = ylc.SnapshotStore(root)
+        record(results, "SnapshotStore.append", len(df), lambda: store.append(df.assign(timestamp=pd.Timestamp.now())), repeat)
+        record(results, "SnapshotStore.latest[display]", len(df),
+               lambda: ylc.SnapshotStore(root).latest(columns=ylc.DISPLAY_COLUMNS), repeat)
+        record(results, "SnapshotStore.changes", len(df), lambda: ylc.SnapshotStore(root).changes(), 1)
+
+def bench_table_model(results, rankings, repeat):
+    try:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PyQt6.QtWidgets import QApplication
+        from consensus_gui import ProjectionTableModel
+    except ImportError as e:
+        results.append({"stage": "ProjectionTableModel", "rows": len(rankings), "skipped": str(e)})
+        return
+    app = QApplication.instance() or QApplication([])
+    model = ProjectionTableModel()
+    record(results, "ProjectionTableModel.set_frame", len(rankings), lambda: model.set_frame(rankings), repeat)
+    record(results, "filter_pos[all positions]", len(rankings),
+           lambda: [model.set_position(p) for p in ["ALL"] + ylc.POSITIONS], repeat)
+
+class _QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+def bench_scrape_local(results, repeat):
+    """scrape_sources over HTTP against the fixtures served from a local server."""
+    handler = functools.partial(_QuietHandler, directory=FIXTURES)
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    sources = {"Local": {**ylc.SOURCES["FantasyPros"], "url": f"http://127.0.0.1:{server.server_port}/{{pos}}.html"}}
+    try:
+        rows = len(asyncio.run(ylc.scrape_sources(sources=sources, fetch_cache=ylc.FetchCache(path=None))))
+        record(results, "scrape_sources[local http]", rows,
+               lambda: asyncio.run(ylc.scrape_sources(sources=sources, fetch_cache=ylc.FetchCache(path=None))), repeat)
+    except ImportError as e:
+        results.append({"stage": "scrape_sources[local http]", "skipped": str(e)})
+    finally:
+        server.shutdown()
+
+def bench_simulation(results, df):
+    sample = ylc.resolve_players(df[df["player"].isin(df["player"].unique()[:500])], ylc.PlayerResolver(path=None))
+    players = sample["player_id"].nunique()
+    record(results, "simulate_outcomes[10k draws]", players, lambda: ylc.simulate_outcomes(sample, 10_000, seed=0), 1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time every pipeline stage on synthetic data and emit JSON.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="synthetic row counts")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement (best and mean are reported)")
+    parser.add_argument("--skip", nargs="*", default=[], choices=["scoring", "parsing", "consensus", "cache", "gui", "scrape", "simulation"])
+    parser.add_argument("--write-fixtures", action="store_true", help="regenerate fixtures/*.html and exit")
+    parser.add_argument("--record-fixtures", action="store_true", help="save the live pages to fixtures/recorded/ and exit")
+    parser.add_argument("-o", "--output", default="-", help='JSON results file, or "-" for stdout')
+    args = parser.parse_args(argv)
+    if args.write_fixtures:
+        write_fixtures()
+        return 0
+    if args.record_fixtures:
+        record_fixtures()
+        return 0
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE, capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ""
+    report = {
+        "started": pd.Timestamp.now().isoformat(timespec="seconds"), "commit": commit,
+        "python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count(),
+        "numpy": np.__version__, "pandas": pd.__version__, "results": [],
+    }
+    results = report["results"]
+    # Stores and caches the pipeline writes go to a scratch directory, not the repo
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        try:
+            if "parsing" not in args.skip:
+                bench_parsing(results, load_fixtures(), args.repeat)
+            if "scrape" not in args.skip:
+                bench_scrape_local(results, args.repeat)
+            for size in args.sizes:
+                df = synthetic_projections(size)
+                if "scoring" not in args.skip:
+                    bench_scoring(results, df, args.repeat)
+                if "consensus" not in args.skip:
+                    bench_consensus(results, df, args.repeat)
+                if "cache" not in args.skip:
+                    bench_cache(results, df, args.repeat)
+                if "gui" not in args.skip:
+                    bench_table_model(results, ylc.build_rankings(df, ylc.PlayerResolver(path=None)), args.repeat)
+            if "simulation" not in args.skip:
+                bench_simulation(results, synthetic_projections(2_000))
+        finally:
+            os.chdir(cwd)
+
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=1)
+        print()
+    else:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=1)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
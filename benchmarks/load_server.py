@@ -0,0 +1,105 @@
+# load_server.py
+# Many concurrent keep-alive clients against the rankings server - results as JSON
+#
+#   python benchmarks/load_server.py                          # 500 clients, in-process server
+#   python benchmarks/load_server.py --clients 2000 --requests 50
+#   python benchmarks/load_server.py --url http://127.0.0.1:8765   # a running --serve instance
+
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import platform
+import threading
+import urllib.parse
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+sys.path.insert(0, HERE)
+import YourLeagueConsensus as ylc
+from bench_pipeline import synthetic_projections
+
+QUERIES = [f"/rankings?pos={pos}&limit={limit}&offset={offset}"
+           for pos in ["ALL"] + ylc.POSITIONS for limit in (10, 30, 100) for offset in (0, 30)] + ["/health"]
+
+
+def start_local_server(rows):
+    """RankingsServer over synthetic rankings on an ephemeral port, its loop in a thread; returns the port."""
+    server = ylc.RankingsServer()
+    server.index = ylc.RankingsIndex(ylc.build_rankings(synthetic_projections(rows), ylc.PlayerResolver(path=None)))
+    loop = asyncio.new_event_loop()
+    listener = loop.run_until_complete(asyncio.start_server(server._handle, "127.0.0.1", 0, backlog=4096))
+    threading.Thread(target=loop.run_forever, name="rankings-server", daemon=True).start()
+    return listener.sockets[0].getsockname()[1]
+
+
+async def client(host, port, requests, latencies, errors, seed):
+    """One keep-alive connection sending requests GETs back to back."""
+    rng = random.Random(seed)
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+    except OSError as e:
+        errors.append(repr(e))
+        return
+    try:
+        for _ in range(requests):
+            started = time.perf_counter()
+            writer.write(f"GET {rng.choice(QUERIES)} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode())
+            await writer.drain()
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = int(head.lower().split(b"content-length:")[1].split(b"\r\n")[0])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - started)
+            if not head.startswith(b"HTTP/1.1 200"):
+                errors.append(head.split(b"\r\n")[0].decode())
+    except (OSError, asyncio.IncompleteReadError) as e:
+        errors.append(repr(e))
+    finally:
+        writer.close()
+
+
+async def run(host, port, clients, requests):
+    latencies, errors = [], []
+    started = time.perf_counter()
+    await asyncio.gather(*(client(host, port, requests, latencies, errors, i) for i in range(clients)))
+    return latencies, errors, time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the rankings server with concurrent keep-alive clients.")
+    parser.add_argument("--clients", type=int, default=500, help="concurrent connections")
+    parser.add_argument("--requests", type=int, default=20, help="requests per connection")
+    parser.add_argument("--rows", type=int, default=4_000, help="synthetic projection rows for the in-process server")
+    parser.add_argument("--url", help="load an already running server instead of starting one")
+    parser.add_argument("-o", "--output", default="-", help='JSON results file, or "-" for stdout')
+    args = parser.parse_args(argv)
+
+    if args.url:
+        target = urllib.parse.urlsplit(args.url)
+        host, port = target.hostname, target.port or 80
+    else:
+        host, port = "127.0.0.1", start_local_server(args.rows)
+    latencies, errors, wall = asyncio.run(run(host, port, args.clients, args.requests))
+    ms = np.array(latencies) * 1000 if latencies else np.zeros(1)
+    report = {
+        "started": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+        "platform": platform.platform(), "cpus": os.cpu_count(), "server": args.url or "in-process",
+        "clients": args.clients, "requests": len(latencies), "errors": len(errors), "first_errors": errors[:5],
+        "wall_s": round(wall, 3), "requests_per_s": round(len(latencies) / wall, 1),
+        "latency_ms": {"p50": round(float(np.percentile(ms, 50)), 2), "p95": round(float(np.percentile(ms, 95)), 2),
+                       "p99": round(float(np.percentile(ms, 99)), 2), "max": round(float(ms.max()), 2)},
+    }
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=1)
+        print()
+    else:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=1)
+    return 1 if errors else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,294 @@
+# consensus_gui.py
+# PyQt6 front end for YourLeagueConsensus.py - imported only when the GUI is launched
+
+import sys
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from PyQt6.QtWidgets import *
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor
+
+from YourLeagueConsensus import (
+    DISPLAY_COLUMNS, SIMULATION_DRAWS, SOURCES, BrowserSession, FetchCache, RunReport, build_rankings, load_cache,
+)
+
+# ============================= WORKER THREAD =============================
+class ScrapeThread(QThread):
+    """One update. The browser session belongs to the window and outlives the thread,
+    so only the first update launches Chromium."""
+    finished = pyqtSignal(pd.DataFrame)
+    failed = pyqtSignal(str)
+    progress = pyqtSignal(int, int, str)  # (units done, units total, message)
+
+    def __init__(self, session, parent=None):
+        super().__init__(parent)
+        self.session = session
+
+    def run(self):
+        self.report = RunReport(on_progress=self.progress.emit)
+        self.report.expect(1)  # Building the rankings, after every page and the snapshot
+        self.progress.emit(0, 1, "Checking cache... Scraping fresh projections from FantasyPros + others...")
+        self.fetch_cache = FetchCache()
+        try:
+            df = self.session.scrape(fetch_cache=self.fetch_cache, report=self.report)
+            if df.empty:
+                self.failed.emit(f"No data—check internet or try again! ({self.report.summary()}, "
+                                 f"see {self.report.save()})")
+                return
+            rankings = build_rankings(df, draws=SIMULATION_DRAWS, report=self.report)
+        except Exception as e:
+            # Keep the window usable and record what broke
+            self.report.error("update", e)
+            self.failed.emit(f"Update failed: {e!r} (see {self.report.save()})")
+            return
+        self.report.advance("Built rankings")
+        self.report_path = self.report.save()
+        self.finished.emit(rankings)
+
+class SimulateThread(QThread):
+    """Simulated floor/ceiling for the cached snapshot. The cache view is shown from the
+    display columns first; this reads the stat columns and simulates off the GUI thread."""
+    finished = pyqtSignal(pd.DataFrame)
+    failed = pyqtSignal(str)
+
+    def run(self):
+        try:
+            df = load_cache()
+            if not df.empty:
+                self.finished.emit(build_rankings(df, draws=SIMULATION_DRAWS))
+        except Exception as e:
+            self.failed.emit(f"Floor/ceiling simulation failed: {e!r}")
+
+# ============================= GUI =============================
+TABLE_COLUMNS = [  # (header, DataFrame column, display format)
+    ("Overall Rank", "overall_rank", "{:.0f}"),
+    ("Pos Rank", "pos_rank", "{:.0f}"),
+    ("Player", "player", "{}"),
+    ("Team", "team", "{}"),
+    ("Pos", "pos", "{}"),
+    ("Opp", "opp", "{}"),
+    ("Consensus Pts", "consensus", "{:.1f}"),
+    ("Floor", "floor", "{:.1f}"),
+    ("Ceiling", "ceiling", "{:.1f}"),
+    ("Boom %", "boom", "{:.0%}"),
+    ("Bust %", "bust", "{:.0%}"),
+]
+
+class ProjectionTableModel(QAbstractTableModel):
+    """Read-only table model serving cells straight from a DataFrame's column arrays.
+
+    Filtering and sorting only swap self._rows, an index array into those columns:
+    each column's sort order is argsorted once and cached, and each position's row
+    mask is built once per frame. Qt then only asks for the cells it paints.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._sort = None  # (column, Qt.SortOrder) last requested by the view
+        self._pos = "ALL"
+        self.set_frame(pd.DataFrame())
+
+    def set_frame(self, df):
+        self.beginResetModel()
+        n = len(df)
+        self._columns = [df[col].to_numpy() if col in df else np.full(n, np.nan) for _, col, _ in TABLE_COLUMNS]
+        pos = df["pos"].to_numpy() if "pos" in df else np.full(n, "", dtype=object)
+        self._dst = pos == "DST"
+        self._masks = {p: pos == p for p in pd.unique(pos)}
+        self._orders = {}
+        self._rows = self._select()
+        self.endResetModel()
+
+    def set_position(self, pos):
+        self.beginResetModel()
+        self._pos = pos
+        self._rows = self._select()
+        self.endResetModel()
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self.beginResetModel()
+        self._sort = (column, order)
+        self._rows = self._select()
+        self.endResetModel()
+
+    def _select(self):
+        n = len(self._dst)
+        if self._sort is None or self._sort[0] < 0:
+            rows = np.arange(n)
+        else:
+            if self._sort not in self._orders:
+                column, order = self._sort
+                values = pd.Series(self._columns[column])
+                self._orders[self._sort] = values.sort_values(
+                    ascending=order == Qt.SortOrder.AscendingOrder, kind="stable", na_position="last").index.to_numpy()
+            rows = self._orders[self._sort]
+        if self._pos != "ALL":
+            rows = rows[self._masks.get(self._pos, np.zeros(n, dtype=bool))[rows]]
+        return rows
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(TABLE_COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return TABLE_COLUMNS[section][0]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            value = self._columns[index.column()][row]
+            return "—" if pd.isna(value) else TABLE_COLUMNS[index.column()][2].format(value)
+        if role == Qt.ItemDataRole.ForegroundRole and self._dst[row]:
+            return QColor(0, 255, 0)  # Green for DST
+        return None
+
+class MainWindow(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Your Custom League Consensus Projections (2025)")
+        self.setGeometry(100, 50, 1400, 900)
+        self.setStyleSheet("""
+            QMainWindow { background: #0f1620; color: #e0e0e0; }
+            QLabel { color: #e0e0e0; font-size: 11pt; }
+            QTableView { background: #1a2332; gridline-color: #333; font-size: 10pt; }
+            QPushButton { background: #00bfff; color: black; font-weight: bold; padding: 10px; border-radius: 5px; }
+            QComboBox { background: #1a2332; color: #e0e0e0; padding: 5px; }
+        """)
+
+        central = QWidget()
+        layout = QVBoxLayout()
+
+        title = QLabel("<h1 style='color:#00bfff'>Your League Custom Scoring Consensus</h1>")
+        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(title)
+
+        controls = QHBoxLayout()
+        QLabel("Position:").setStyleSheet("color:#888;")
+        self.pos_filter = QComboBox()
+        self.pos_filter.addItems(["ALL", "QB", "RB", "WR", "TE", "K", "DST"])
+        self.pos_filter.currentTextChanged.connect(self.filter_pos)
+        controls.addWidget(self.pos_filter)
+
+        self.update_btn = QPushButton("🔄 Update Projections (Live Scrape)")
+        self.update_btn.clicked.connect(self.start_update)
+        controls.addWidget(self.update_btn)
+
+        self.cache_btn = QPushButton("📁 Load from Cache (Fast)")
+        self.cache_btn.clicked.connect(self.load_cache)
+        controls.addWidget(self.cache_btn)
+        controls.addStretch()
+        layout.addLayout(controls)
+
+        self.progress = QProgressBar()
+        self.progress.setVisible(False)
+        layout.addWidget(self.progress)
+
+        self.status = QLabel("Ready—Try 'Load from Cache' for instant view or Update for fresh data.")
+        layout.addWidget(self.status)
+
+        # Table like FantasyPros
+        self.model = ProjectionTableModel()
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSortingEnabled(True)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setAlternatingRowColors(True)
+        layout.addWidget(self.table, 1)
+
+        central.setLayout(layout)
+        self.setCentralWidget(central)
+        self.full_df = pd.DataFrame()
+        self.session = None  # BrowserSession, started by the first update and kept until the window closes
+        self.simulation = None  # SimulateThread of the latest cache load
+        self.load_cache()  # Auto-load cache on start
+
+    def start_update(self):
+        self.drop_simulation()  # The update brings its own simulated values
+        self.update_btn.setEnabled(False)
+        self.cache_btn.setEnabled(False)
+        self.progress.setVisible(True)
+        self.progress.setValue(0)
+        self.status.setText(f"Live scraping {sum(len(spec['positions']) for spec in SOURCES.values())} pages...")
+        if self.session is None:
+            self.session = BrowserSession()
+        self.thread = ScrapeThread(self.session)
+        self.thread.progress.connect(self.update_progress)
+        self.thread.finished.connect(self.show_update)
+        self.thread.failed.connect(self.show_failure)
+        self.thread.start()
+
+    def closeEvent(self, event):
+        self.drop_simulation()
+        if self.simulation is not None:
+            self.simulation.wait()
+        if self.session is not None:
+            if self.thread.isRunning():
+                self.thread.wait()
+            self.session.close()
+        super().closeEvent(event)
+
+    def update_progress(self, done, total, msg):
+        self.status.setText(f"{msg} — {done}/{total}")
+        self.progress.setMaximum(total)
+        self.progress.setValue(done)
+
+    def load_cache(self):
+        df = load_cache(columns=DISPLAY_COLUMNS)
+        if not df.empty:
+            self.display_results(build_rankings(df))
+            self.status.setText(f"{self.status.text()} (from cache; simulating floor/ceiling...). Click Update for fresh.")
+            # Source-spread floor/ceiling until the simulation (same as after an update) replaces them
+            self.drop_simulation()
+            self.simulation = SimulateThread(self)
+            self.simulation.finished.connect(self.show_simulated)
+            self.simulation.failed.connect(self.status.setText)
+            self.simulation.start()
+        else:
+            self.status.setText("No cache found—run Update first!")
+
+    def drop_simulation(self):
+        """Ignore a cache simulation still running (a newer load or an update supersedes it)."""
+        if self.simulation is not None and self.simulation.isRunning():
+            self.simulation.finished.disconnect()
+            self.simulation.failed.disconnect()
+
+    def show_simulated(self, df):
+        self.display_results(df)
+        self.status.setText(f"{self.status.text()} (from cache). Click Update for fresh.")
+
+    def show_update(self, df):
+        self.display_results(df)
+        self.status.setText(f"{self.status.text()} | {self.thread.fetch_cache.summary()} | {self.thread.report.summary()}")
+
+    def show_failure(self, msg):
+        self.update_btn.setEnabled(True)
+        self.cache_btn.setEnabled(True)
+        self.progress.setVisible(False)
+        self.status.setText(msg)
+
+    def display_results(self, df):
+        self.full_df = df
+        self.model.set_frame(df)
+        self.update_btn.setEnabled(True)
+        self.cache_btn.setEnabled(True)
+        self.progress.setVisible(False)
+        self.progress.setValue(100)
+        timestamp = df['timestamp'].max() if 'timestamp' in df and df['timestamp'].notna().any() else datetime.now()
+        self.status.setText(f"Loaded {len(df)} projections | Updated: {timestamp.strftime('%b %d, %Y %I:%M %p')}")
+
+    def filter_pos(self, pos):
+        self.model.set_position(pos)
+
+def run_gui(argv=None):
+    app = QApplication(sys.argv if argv is None else argv)
+    app.setStyle("Fusion")
+    window = MainWindow()
+    window.show()
+    return app.exec()
@@ -0,0 +1,117 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(autouse=True)
+def scratch_dir(tmp_path, monkeypatch):
+    """Caches, snapshots and reports are written to the working directory; keep them out of the repo."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "fixtures")
+
+
+def fixture_html(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+class PageServer:
+    """Local HTTP server serving configurable pages: body, delay, status, ETag and gzip per path.
+
+    Requests carrying a matching If-None-Match get 304; requests holds every path served.
+    """
+
+    def __init__(self):
+        import http.server
+        import threading
+
+        self.pages = {}
+        self.requests = []
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                import time
+                page = server.pages.get(self.path.split("?")[0])
+                server.requests.append(self.path)
+                if page is None:
+                    self.send_error(404)
+                    return
+                time.sleep(page.get("delay", 0))
+                etag = page.get("etag")
+                if etag and self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                body = page.get("body", "").encode()
+                self.send_response(page.get("status", 200))
+                if etag:
+                    self.send_header("ETag", etag)
+                if page.get("gzip"):
+                    import gzip
+                    body = gzip.compress(body)
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def url(self, path=""):
+        return f"http://127.0.0.1:{self.httpd.server_port}{path}"
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def page_server():
+    server = PageServer()
+    yield server
+    server.close()
+
+
+class FailingBrowser:
+    """Stand-in "browser" backend that records fallbacks and fails them (no Chromium needed)."""
+
+    def __init__(self, html=None):
+        self.html = html
+        self.urls = []
+
+    async def fetch(self, url, selector=None, cached=None, report=None):
+        self.urls.append(url)
+        if self.html is None:
+            raise RuntimeError("no browser in tests")
+        return self.html, None, None
+
+
+def local_source(server, positions, **spec):
+    """SOURCES entry pointing the FantasyPros parser at the page server."""
+    import YourLeagueConsensus as ylc
+    return {"Local": {**ylc.SOURCES["FantasyPros"], "url": server.url("/{pos}.html"), "positions": positions, **spec}}
+
+
+def scrape(sources, report=None, fetch_cache=None, browser=None):
+    """scrape_sources over a real HttpFetcher with a stand-in browser."""
+    import asyncio
+    import YourLeagueConsensus as ylc
+
+    async def go():
+        async with ylc.HttpFetcher() as http:
+            fetchers = {"http": http, "browser": browser or FailingBrowser()}
+            return await ylc.scrape_sources(sources=sources, fetchers=fetchers, report=report,
+                                            fetch_cache=fetch_cache or ylc.FetchCache(path=None))
+    return asyncio.run(go())
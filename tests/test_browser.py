@@ -0,0 +1,144 @@
+import asyncio
+
+import playwright.async_api
+import pytest
+
+import YourLeagueConsensus as ylc
+
+
+class FakePage:
+    def __init__(self, browser):
+        self.browser = browser
+        self.closed = False
+
+    def on(self, event, handler):
+        pass
+
+    def remove_listener(self, event, handler):
+        pass
+
+    async def goto(self, url, **kwargs):
+        await self.browser.hold.wait()
+
+    async def wait_for_selector(self, selector, **kwargs):
+        pass
+
+    async def content(self):
+        return f"<html>{self.browser.name}</html>"
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, playwright):
+        self.name = f"browser{len(playwright.launched)}"
+        self.connected = True
+        self.hold = asyncio.Event()
+        self.hold.set()
+        self.new_page_errors = playwright.new_page_errors
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **kwargs):
+        return self
+
+    async def route(self, pattern, handler):
+        pass
+
+    def set_default_timeout(self, ms):
+        pass
+
+    async def new_page(self):
+        if self.new_page_errors:
+            raise self.new_page_errors.pop(0)
+        return FakePage(self)
+
+    async def close(self):
+        self.connected = False
+
+
+class FakePlaywright:
+    """Stands in for async_playwright(): records starts, stops and launches."""
+
+    def __init__(self, launch_error=None):
+        self.launch_error = launch_error
+        self.launched, self.started, self.stopped = [], 0, 0
+        self.new_page_errors = []
+        self.chromium = self
+
+    def __call__(self):
+        return self
+
+    async def start(self):
+        self.started += 1
+        return self
+
+    async def stop(self):
+        self.stopped += 1
+
+    async def launch(self, **kwargs):
+        if self.launch_error is not None:
+            raise self.launch_error
+        self.launched.append(FakeBrowser(self))
+        return self.launched[-1]
+
+
+@pytest.fixture
+def fake_playwright(monkeypatch):
+    fake = FakePlaywright()
+    monkeypatch.setattr(playwright.async_api, "async_playwright", fake)
+    return fake
+
+
+def test_failed_launch_stops_the_driver_and_fails_the_rest_of_the_update_fast(fake_playwright):
+    fake_playwright.launch_error = RuntimeError("Executable doesn't exist")
+
+    async def go():
+        fetcher = ylc.BrowserFetcher(max_pages=2)
+        report = ylc.RunReport()
+        results = await asyncio.gather(*(fetcher.fetch(f"http://x/{i}", report=report) for i in range(4)),
+                                       return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert (fake_playwright.started, fake_playwright.stopped) == (1, 1)
+        assert len([s for s in report.spans if s["stage"] == "browser_launch"]) == 1
+        # The next update tries again
+        fake_playwright.launch_error = None
+        html, _, _ = await fetcher.fetch("http://x/0", report=ylc.RunReport())
+        assert html == "<html>browser0</html>"
+        await fetcher.__aexit__(None, None, None)
+        assert fake_playwright.stopped == 2
+    asyncio.run(go())
+
+
+def test_failed_new_page_keeps_its_pool_slot(fake_playwright):
+    fake_playwright.new_page_errors = [RuntimeError("target closed")]
+
+    async def go():
+        fetcher = ylc.BrowserFetcher(max_pages=1)
+        with pytest.raises(RuntimeError):
+            await fetcher.fetch("http://x/0")
+        html, _, _ = await asyncio.wait_for(fetcher.fetch("http://x/1"), 2)
+        assert html == "<html>browser0</html>"
+    asyncio.run(go())
+
+
+def test_pages_out_during_a_relaunch_go_back_to_the_old_pool(fake_playwright):
+    async def go():
+        fetcher = ylc.BrowserFetcher(max_pages=2)
+        await fetcher.fetch("http://x/warmup")
+        old_browser, old_pool = fake_playwright.launched[0], fetcher.pool
+        old_browser.hold.clear()
+        in_flight = asyncio.create_task(fetcher.fetch("http://x/slow"))
+        await asyncio.sleep(0)
+        old_browser.connected = False  # Chromium died; the next fetch relaunches
+        html, _, _ = await fetcher.fetch("http://x/new")
+        assert html == "<html>browser1</html>"
+        old_browser.hold.set()
+        await in_flight
+        new_pages = [fetcher.pool.get_nowait() for _ in range(fetcher.pool.qsize())]
+        assert len(new_pages) == 2
+        assert all(page is None or page.browser is fake_playwright.launched[1] for page in new_pages)
+        assert old_pool is not fetcher.pool
+    asyncio.run(go())
@@ -0,0 +1,79 @@
+import json
+import numpy as np
+import pandas as pd
+
+import YourLeagueConsensus as ylc
+
+
+def rows(*specs):
+    """(source, team, opp, points, timestamp) tuples for one player."""
+    return pd.DataFrame([{"player": "Renla Kalason", "pos": "WR", "source": src, "team": team, "opp": opp,
+                          "source_points": pts, "timestamp": pd.Timestamp(ts)} for src, team, opp, pts, ts in specs])
+
+
+def test_carried_columns_come_from_the_heaviest_source():
+    df = rows(("Low", "OLD", "vs NYJ", 5.0, "2025-10-02"), ("High", "BUF", "vs MIA", 20.0, "2025-10-01"))
+    out = ylc.compute_consensus(df, weights={"High": 2.0, "Low": 0.5}, keys=["player", "pos"])
+    assert out.loc[0, ["team", "opp"]].tolist() == ["BUF", "vs MIA"]
+
+
+def test_equal_weights_take_the_newest_pull_whatever_the_points():
+    df = rows(("A", "NEW", "vs KC", 1.0, "2025-10-03"), ("B", "OLD", "vs LV", 30.0, "2025-10-01"),
+              ("C", "OLD", "vs LV", 15.0, "2025-10-02"))
+    for shuffled in (df, df.iloc[::-1], df.sample(frac=1, random_state=1)):
+        out = ylc.compute_consensus(shuffled, keys=["player", "pos"])
+        assert out.loc[0, ["team", "opp"]].tolist() == ["NEW", "vs KC"]
+
+
+def test_consensus_statistics_match_pandas():
+    rng = np.random.default_rng(0)
+    n = 400
+    df = pd.DataFrame({
+        "player": rng.choice([f"P{i}" for i in range(60)], n), "team": "BUF", "pos": "RB",
+        "source": rng.choice(["S1", "S2", "S3"], n), "source_points": rng.normal(10, 4, n).round(2),
+        "opp_pts": rng.uniform(10, 30, n),
+    })
+    out = ylc.compute_consensus(df, weights={}, keys=["player"]).set_index("player").sort_index()
+    grouped = df.groupby("player")
+    np.testing.assert_allclose(out["consensus"], grouped["source_points"].mean())
+    np.testing.assert_allclose(out["floor"], grouped["source_points"].quantile(0.1))
+    np.testing.assert_allclose(out["ceiling"], grouped["source_points"].quantile(0.9))
+    np.testing.assert_allclose(out["opp_pts"], grouped["opp_pts"].mean())
+    np.testing.assert_array_equal(out["sources"], grouped["source"].nunique())
+    assert out["overall_rank"].sort_values().tolist() == list(range(1, len(out) + 1))
+
+
+def two_weeks():
+    df = pd.DataFrame([{"player": name, "team": "BUF", "pos": pos, "opp": "", "source": src, "week": week,
+                        "pass_yds": yds, "pass_td": 2.0}
+                       for week, scale in (("1", 1.0), ("2", 0.5))
+                       for name, pos, base in (("Josh Allen", "QB", 300.0), ("Renla Kalason", "QB", 250.0))
+                       for src, yds in (("A", base * scale), ("B", base * scale + 10))])
+    df["source_points"] = ylc.SCORING_ENGINE.score(df)
+    return df
+
+
+def test_weeks_are_ranked_separately():
+    rankings = ylc.build_rankings(two_weeks(), ylc.PlayerResolver(path=None), draws=200)
+    assert rankings[["week", "player", "overall_rank", "pos_rank"]].values.tolist() == [
+        ["1", "Josh Allen", 1, 1], ["1", "Renla Kalason", 2, 2],
+        ["2", "Josh Allen", 1, 1], ["2", "Renla Kalason", 2, 2]]
+    assert rankings["sources"].tolist() == [2, 2, 2, 2]
+    week1, week2 = rankings.groupby("week")["consensus"]
+    assert (week1[1].to_numpy() > week2[1].to_numpy()).all()
+    assert (rankings["floor"] <= rankings["consensus"]).all() and (rankings["ceiling"] > rankings["floor"]).all()
+    assert rankings.loc[0, "ceiling"] > rankings.loc[2, "ceiling"]  # Week 2 is simulated from week 2 stats
+
+
+def test_profile_ranks_are_per_week():
+    rankings = ylc.build_profile_rankings(two_weeks(), {"default": ylc.CUSTOM_SCORING}, ylc.PlayerResolver(path=None))
+    assert rankings["rank_default"].tolist() == [1, 2, 1, 2]
+
+
+def test_index_serves_one_week_at_a_time():
+    index = ylc.RankingsIndex(ylc.build_rankings(two_weeks(), ylc.PlayerResolver(path=None)))
+    first = json.loads(index.query())
+    assert (first["week"], first["total"]) == ("1", 2)
+    second = json.loads(index.query("QB", week="2"))
+    assert [p["week"] for p in second["players"]] == ["2", "2"]
+    assert json.loads(index.query(week="9"))["total"] == 0
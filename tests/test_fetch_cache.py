@@ -0,0 +1,110 @@
+import asyncio
+
+import httpx
+import pytest
+
+import YourLeagueConsensus as ylc
+from conftest import FailingBrowser, fixture_html, local_source, scrape
+
+
+def counting_source(server, positions):
+    """Local source whose parser counts its calls, so reused pages can be told from re-parsed ones."""
+    calls = []
+
+    def parser(html, pos, counts=None):
+        calls.append(pos)
+        return ylc.parse_projection_table(html, pos, counts=counts)
+    return local_source(server, positions, parser=parser), calls
+
+
+def statuses(report):
+    return sorted(page["status"] for page in report.pages.values())
+
+
+def test_pages_inside_the_ttl_are_not_requested(page_server):
+    page_server.pages["/qb.html"] = {"body": fixture_html("qb.html")}
+    sources, calls = counting_source(page_server, ["QB"])
+    cache = ylc.FetchCache(path=None)
+    first = scrape(sources, fetch_cache=cache)
+    report = ylc.RunReport()
+    second = scrape(sources, fetch_cache=cache, report=report)
+    assert len(page_server.requests) == 1
+    assert calls == ["QB"]
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert statuses(report) == ["cached"]
+    assert len(second) == len(first) == 50
+
+
+def test_304_reuses_cached_rows(page_server):
+    page_server.pages["/qb.html"] = {"body": fixture_html("qb.html"), "etag": '"v1"'}
+    sources, calls = counting_source(page_server, ["QB"])
+    cache = ylc.FetchCache(path=None, ttl=0)
+    scrape(sources, fetch_cache=cache)
+    report = ylc.RunReport()
+    scrape(sources, fetch_cache=cache, report=report)
+    assert len(page_server.requests) == 2
+    assert calls == ["QB"]
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert statuses(report) == ["not_modified"]
+
+
+def test_changed_etag_is_parsed_again(page_server):
+    page_server.pages["/qb.html"] = {"body": fixture_html("qb.html"), "etag": '"v1"'}
+    sources, calls = counting_source(page_server, ["QB"])
+    cache = ylc.FetchCache(path=None, ttl=0)
+    scrape(sources, fetch_cache=cache)
+    page_server.pages["/qb.html"] = {"body": fixture_html("rb.html"), "etag": '"v2"'}
+    scrape(sources, fetch_cache=cache)
+    assert calls == ["QB", "QB"]
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_unchanged_body_without_validators_is_not_parsed_again(page_server):
+    page_server.pages["/qb.html"] = {"body": fixture_html("qb.html")}
+    sources, calls = counting_source(page_server, ["QB"])
+    cache = ylc.FetchCache(path=None, ttl=0)
+    scrape(sources, fetch_cache=cache)
+    report = ylc.RunReport()
+    scrape(sources, fetch_cache=cache, report=report)
+    assert len(page_server.requests) == 2
+    assert calls == ["QB"]
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert statuses(report) == ["unchanged"]
+
+
+def test_browser_fallback_rows_are_cached(page_server):
+    # The served HTML has no table (rendered client-side); the browser returns the real page
+    page_server.pages["/qb.html"] = {"body": "<html><body><div id='app'></div></body></html>"}
+    sources, calls = counting_source(page_server, ["QB"])
+    browser = FailingBrowser(html=fixture_html("qb.html"))
+    cache = ylc.FetchCache(path=None)
+    report = ylc.RunReport()
+    first = scrape(sources, fetch_cache=cache, browser=browser, report=report)
+    assert len(first) == 50
+    assert len(browser.urls) == 1
+    assert [page["backend"] for page in report.pages.values()] == ["browser"]
+    second = scrape(sources, fetch_cache=cache, browser=browser)
+    assert len(second) == 50
+    assert len(browser.urls) == 1 and len(page_server.requests) == 1
+    assert calls == ["QB", "QB"]  # Served HTML, then the browser's; nothing on the cached run
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_survives_a_restart(page_server):
+    page_server.pages["/qb.html"] = {"body": fixture_html("qb.html")}
+    sources, calls = counting_source(page_server, ["QB"])
+    scrape(sources, fetch_cache=ylc.FetchCache("fetch_cache.json"))
+    reloaded = ylc.FetchCache("fetch_cache.json")
+    scrape(sources, fetch_cache=reloaded)
+    assert calls == ["QB"]
+    assert reloaded.hits == 1
+
+
+def test_unexpected_304_without_a_cache_entry_is_an_http_error(page_server):
+    page_server.pages["/qb.html"] = {"status": 304}
+
+    async def go():
+        async with ylc.HttpFetcher() as http:
+            return await http.fetch(page_server.url("/qb.html"))
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(go())
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+
+import YourLeagueConsensus as ylc
+from conftest import fixture_html, local_source, scrape
+
+
+def cached_pull(page_server):
+    page_server.pages["/qb.html"] = {"body": fixture_html("qb.html")}
+    page_server.pages["/wr.html"] = {"body": fixture_html("wr.html")}
+    return scrape(local_source(page_server, ["QB", "WR"]), fetch_cache=ylc.FetchCache(path=None))
+
+
+def test_cache_runs_simulate_floor_and_ceiling_like_live_ones(page_server):
+    live = ylc.build_rankings(cached_pull(page_server), draws=500)
+    assert ylc.main(["--headless", "--from-cache", "--simulate", "500", "-o", "cached.csv"]) == 0
+    cached = pd.read_csv("cached.csv")
+    assert {"boom", "bust"} <= set(cached) and cached["boom"].notna().all()
+    # Same stat lines, same model, same seed: the same numbers
+    both = live.merge(cached, on=["player", "pos"], suffixes=("_live", "_cached"))
+    assert len(both) == len(live) == 100
+    for col in ("floor", "ceiling", "boom", "bust"):
+        np.testing.assert_allclose(both[f"{col}_cached"], both[f"{col}_live"], atol=0.01)
+    assert (both["floor_cached"] < both["consensus_cached"]).all()
+
+
+def test_simulation_does_not_depend_on_row_order(page_server):
+    df = ylc.resolve_players(cached_pull(page_server))
+    first = ylc.simulate_outcomes(df, 300)
+    shuffled = ylc.simulate_outcomes(df.sample(frac=1, random_state=3), 300)
+    pd.testing.assert_frame_equal(first, shuffled)
+
+
+def test_headless_default_keeps_the_source_spread(page_server):
+    cached_pull(page_server)
+    assert ylc.main(["--headless", "--from-cache", "-o", "cached.csv"]) == 0
+    cached = pd.read_csv("cached.csv")
+    assert "boom" not in cached
+    assert (cached["floor"] == cached["consensus"]).all()  # One source: the quantiles are the mean
+
+
+def test_cache_exports_keep_the_week_like_live_ones(page_server):
+    cached_pull(page_server)
+    assert ylc.main(["--headless", "--from-cache", "-o", "cached.csv"]) == 0
+    assert ylc.main(["--headless", "--from-cache", "--simulate", "200", "-o", "simulated.csv"]) == 0
+    cached, simulated = pd.read_csv("cached.csv"), pd.read_csv("simulated.csv")
+    assert cached.columns[0] == simulated.columns[0] == "week"
+    assert set(cached["week"].astype(str)) == {"draft"}
+
+
+def test_bad_output_format_fails_before_scraping(monkeypatch):
+    async def no_scrape(**kwargs):
+        raise AssertionError("scraped before checking the output format")
+    monkeypatch.setattr(ylc, "scrape_sources", no_scrape)
+    assert ylc.main(["--headless", "-o", "rankings.txt"]) == 2
+    assert ylc.main(["--headless", "--format", "xlsx", "-o", "-"]) == 2
@@ -0,0 +1,60 @@
+import pandas as pd
+import pytest
+
+import YourLeagueConsensus as ylc
+
+
+@pytest.mark.parametrize("name, key", [
+    ("Kenneth Walker III", "kenneth walker"), ("A.J. Brown", "aj brown"), ("José Núñez", "jose nunez"),
+    ("李小龙", "李小龙"), ("", ""), ("—", ""), ("  ", ""),
+])
+def test_normalize_name(name, key):
+    assert ylc.normalize_name(name) == key
+
+
+def test_spelling_variants_share_one_id():
+    resolver = ylc.PlayerResolver(path=None)
+    pid = resolver.resolve("Kenneth Walker III", "RB")
+    assert resolver.resolve("K. Walker", "RB") == pid
+    assert resolver.resolve("Kenneth Walkr", "RB") == pid
+    assert resolver.resolve("Kenneth Walker", "WR") != pid
+    assert resolver.players[pid]["name"] == "Kenneth Walker III"
+
+
+def test_team_defenses_are_never_fuzzy_matched():
+    resolver = ylc.PlayerResolver(path=None)
+    assert resolver.resolve("NYG Defense", "DST") != resolver.resolve("NYJ Defense", "DST")
+    assert resolver.resolve("LAC Defense", "DST") != resolver.resolve("LAR Defense", "DST")
+
+
+def test_ambiguous_initial_is_a_new_player():
+    resolver = ylc.PlayerResolver(path=None)
+    ids = {resolver.resolve("Mike Williams", "WR"), resolver.resolve("Marcus Williams", "WR")}
+    assert resolver.resolve("M. Williams", "WR") not in ids
+
+
+def test_blank_names_are_dropped_not_fatal():
+    df = pd.DataFrame({"player": ["Josh Allen", "", "J. Allen", "—"], "pos": "QB", "team": "BUF", "opp": "",
+                       "source": ["A", "B", "C", "D"], "source_points": [20.0, 1.0, 22.0, 3.0]})
+    rankings = ylc.build_rankings(df, ylc.PlayerResolver(path=None))
+    assert rankings[["player", "consensus", "sources"]].values.tolist() == [["Josh Allen", 21.0, 2]]
+
+
+def test_alias_table_round_trips():
+    resolver = ylc.PlayerResolver("aliases.json")
+    pid = resolver.resolve("Kenneth Walker III", "RB")
+    resolver.resolve("K. Walker", "RB")
+    resolver.save()
+    reloaded = ylc.PlayerResolver("aliases.json")
+    assert reloaded.aliases == resolver.aliases
+    assert reloaded.resolve("Kenneth Walkr", "RB") == pid  # Blocks are rebuilt on load
+
+
+def test_blocks_stay_small_as_the_pool_grows():
+    resolver = ylc.PlayerResolver(path=None)
+    syllables = ["ka", "lo", "mi", "ren", "tor", "vas", "zel", "qui", "bra", "dun"]
+    for i in range(5000):
+        surname = "".join(syllables[(i // 10 ** d) % 10] for d in range(4))
+        resolver.resolve(f"{syllables[i % 7]}la {surname}son", "WR")
+    assert len(resolver.players) == 5000
+    assert max(len(block) for block in resolver._blocks.values()) <= 10
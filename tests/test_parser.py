@@ -0,0 +1,93 @@
+import glob
+import os
+
+import pandas as pd
+import pytest
+
+import YourLeagueConsensus as ylc
+from conftest import FIXTURES, fixture_html
+
+RECORDED = sorted(glob.glob(os.path.join(FIXTURES, "recorded", "*.html")))
+
+
+def first_row(pos):
+    return ylc.parse_projection_table(fixture_html(f"{pos.lower()}.html"), pos)[0]
+
+
+@pytest.mark.parametrize("pos", ylc.POSITIONS)
+def test_every_fixture_parses_capped_at_max_rows(pos):
+    counts = {}
+    rows = ylc.parse_projection_table(fixture_html(f"{pos.lower()}.html"), pos, counts=counts)
+    assert len(rows) == 50  # 60 rows on the page, top 50 kept
+    assert counts == {"rows_seen": 60}
+    assert all(row["pos"] == pos for row in rows)
+    assert all(set(ylc.STAT_COLUMNS) <= set(row) for row in rows)
+
+
+def test_max_rows_is_configurable():
+    assert len(ylc.parse_projection_table(fixture_html("wr.html"), "WR", max_rows=10)) == 10
+
+
+def test_player_team_and_opponent_are_split():
+    row = first_row("QB")
+    assert (row["player"], row["team"], row["opp"]) == ("Renla Kalason", "ARI", "vs CLE")
+    assert first_row("DST")["player"] == "ARI Defense"
+
+
+def test_offense_stat_mapping():
+    row = first_row("QB")
+    expected = {
+        "pass_cmp": 191.1, "pass_yds": 12.3, "pass_td": 5.0, "rush_att": 244.0, "rush_yds": 273.8,
+        "rush_td": 182.0, "rec": 218.8, "rec_yds": 163.1, "rec_td": 280.5, "fumble_lost": 244.8,
+        "sacks_taken": 2, "pass_40_plus_cmp": 4.0,
+    }
+    assert {k: row[k] for k in expected} == pytest.approx(expected)
+    assert row["pass_fd"] == pytest.approx(12.3 / 20)
+    assert row["rush_fd"] == pytest.approx(27.38)
+    assert row["rec_fd"] == pytest.approx(16.31)
+    assert first_row("WR")["sacks_taken"] == 0
+
+
+def test_kicker_stat_mapping():
+    row = first_row("K")
+    expected = {"fg_0_19": 75.4, "fg_20_29": 40.9, "fg_30_39": 78.1, "fg_40_49": 6.5, "fg_50_plus": 48.6, "xp_made": 30.1}
+    assert {k: row[k] for k in expected} == pytest.approx(expected)
+    assert row["pass_yds"] == 0
+
+
+def test_defense_stat_mapping():
+    row = first_row("DST")
+    expected = {"def_sacks": 64.4, "def_int": 64.6, "def_fum_rec": 41.2, "def_td": 22.9,
+                "opp_pts": 20, "opp_yds": 350, "def_4th_down_stops": 1}
+    assert {k: row[k] for k in expected} == pytest.approx(expected)
+
+
+def test_short_rows_are_skipped_and_counted():
+    cells = "".join(f"<td>{i}</td>" for i in range(15))
+    html = ('<table class="table-player-table"><tbody>'
+            '<tr><td>Ad slot</td></tr>'
+            f'<tr><td>Josh Allen BUF</td>{cells}</tr>'
+            '<tr><td>Tier 2</td><td></td></tr>'
+            '</tbody></table>')
+    counts = {}
+    rows = ylc.parse_projection_table(html, "QB", counts=counts)
+    assert [(r["player"], r["team"]) for r in rows] == [("Josh Allen", "BUF")]
+    assert counts["rows_seen"] == 3
+
+
+def test_name_without_team_keeps_the_whole_cell():
+    cells = "".join(f"<td>{i}</td>" for i in range(15))
+    html = f'<div id="dataGridView"><table><tbody><tr><td>Free Agent</td>{cells}</tr></tbody></table></div>'
+    row = ylc.parse_projection_table(html, "RB")[0]
+    assert (row["player"], row["team"]) == ("Free Agent", "")
+
+
+@pytest.mark.skipif(not RECORDED, reason="no recorded pages; run benchmarks/bench_pipeline.py --record-fixtures")
+@pytest.mark.parametrize("path", RECORDED, ids=os.path.basename)
+def test_recorded_pages_still_parse(path):
+    pos = os.path.splitext(os.path.basename(path))[0].upper()
+    with open(path, encoding="utf-8") as f:
+        rows = ylc.parse_projection_table(f.read(), pos)
+    assert rows, "the real layout no longer matches ROW_XPATH"
+    assert all(row["player"] and row["team"] for row in rows)
+    assert ylc.SCORING_ENGINE.score(pd.DataFrame(rows)).gt(0).mean() > 0.9
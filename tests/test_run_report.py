@@ -0,0 +1,36 @@
+import gzip
+import os
+from datetime import timedelta
+
+import YourLeagueConsensus as ylc
+from conftest import fixture_html, local_source, scrape
+
+
+def page_bytes(report):
+    return {url.rsplit("/", 1)[1]: page["bytes"] for url, page in report.pages.items()}
+
+
+def test_bytes_are_what_came_over_the_wire(page_server):
+    html = fixture_html("qb.html")
+    page_server.pages["/qb.html"] = {"body": html, "gzip": True, "etag": '"v1"'}
+    page_server.pages["/wr.html"] = {"body": fixture_html("wr.html")}
+    sources = local_source(page_server, ["QB", "WR"])
+    cache = ylc.FetchCache(path=None, ttl=0)
+    report = ylc.RunReport()
+    df = scrape(sources, fetch_cache=cache, report=report)
+    assert len(df) == 100
+    assert page_bytes(report) == {"qb.html": len(gzip.compress(html.encode())),
+                                  "wr.html": len(fixture_html("wr.html").encode())}
+    assert page_bytes(report)["qb.html"] < len(html) / 2
+    report = ylc.RunReport()
+    scrape(sources, fetch_cache=cache, report=report)
+    assert page_bytes(report)["qb.html"] == 0  # 304: no body sent
+
+
+def test_only_the_newest_reports_are_kept():
+    paths = []
+    for i in range(5):
+        report = ylc.RunReport()
+        report.started_at += timedelta(seconds=i)
+        paths.append(report.save(keep=3))
+    assert sorted(os.listdir(ylc.RUN_REPORT_DIR)) == [os.path.basename(p) for p in paths[-3:]]
@@ -0,0 +1,133 @@
+import json
+import numpy as np
+import pandas as pd
+import pytest
+
+import YourLeagueConsensus as ylc
+
+
+def legacy_points(row, is_def=False):
+    """The per-row if/elif scorer ScoringEngine replaced, kept verbatim as the reference."""
+    pts = 0.0
+    if not is_def:
+        pts += row.get('pass_cmp', 0) * 0.1
+        pts += row.get('pass_yds', 0) * (1 / 20)
+        if row.get('pass_yds', 0) >= 400: pts += 4
+        elif row.get('pass_yds', 0) >= 300: pts += 3
+        elif row.get('pass_yds', 0) >= 200: pts += 2
+        pts += row.get('pass_td', 0) * 6
+        pts += row.get('int', 0) * -2
+        pts += row.get('sacks_taken', 0) * -0.25
+        pts += row.get('pick_six', 0) * -2
+        pts += row.get('pass_40_plus_cmp', 0) * 1
+        pts += row.get('pass_40_plus_td', 0) * 1
+        pts += row.get('pass_fd', 0) * 0.1
+        pts += row.get('rush_att', 0) * 0.35
+        pts += row.get('rush_yds', 0) * 0.1
+        if row.get('rush_yds', 0) >= 200: pts += 4
+        elif row.get('rush_yds', 0) >= 100: pts += 3
+        pts += row.get('rush_td', 0) * 6
+        pts += row.get('rush_40_plus', 0) * 2
+        pts += row.get('rush_40_plus_td', 0) * 1
+        pts += row.get('rush_fd', 0) * 0.2
+        pts += row.get('rec', 0) * 0.7
+        pts += row.get('rec_yds', 0) * 0.1
+        if row.get('rec_yds', 0) >= 200: pts += 4
+        elif row.get('rec_yds', 0) >= 100: pts += 3
+        pts += row.get('rec_td', 0) * 6
+        pts += row.get('rec_40_plus', 0) * 2
+        pts += row.get('rec_40_plus_td', 0) * 1
+        pts += row.get('rec_fd', 0) * 0.2
+        pts += row.get('two_pt', 0) * 2
+        pts += row.get('fumble_lost', 0) * -2
+        pts += row.get('fumble_td', 0) * 6
+        pts += row.get('return_yds', 0) / 20
+        pts += row.get('return_td', 0) * 6
+        pts += row.get('fg_0_19', 0) * 3 + row.get('fg_20_29', 0) * 3 + row.get('fg_30_39', 0) * 4
+        pts += row.get('fg_40_49', 0) * 4 + row.get('fg_50_plus', 0) * 5
+        pts += row.get('fg_miss_0_19', 0) * -1 + row.get('fg_miss_20_29', 0) * -1 + row.get('fg_miss_30_39', 0) * -1
+        pts += row.get('fg_miss_40_49', 0) * -1 + row.get('fg_miss_50_plus', 0) * -1
+        pts += row.get('xp_made', 0) * 1 + row.get('xp_miss', 0) * -1
+    else:
+        pa = row.get('opp_pts', 0)
+        if pa == 0: pts += 12
+        elif 1 <= pa <= 6: pts += 8
+        elif 7 <= pa <= 13: pts += 6
+        elif 14 <= pa <= 20: pts += 4
+        elif 21 <= pa <= 27: pts += 2
+        elif 28 <= pa <= 34: pts += 0
+        else: pts += -5
+        ya = row.get('opp_yds', 0)
+        if ya <= 99: pts += 5
+        elif 100 <= ya <= 199: pts += 4
+        elif 200 <= ya <= 299: pts += 2
+        elif 300 <= ya <= 399: pts += 0
+        elif 400 <= ya <= 499: pts += -1
+        else: pts += -3
+        pts += row.get('def_sacks', 0) * 2 + row.get('def_int', 0) * 3 + row.get('def_fum_rec', 0) * 3
+        pts += row.get('def_td', 0) * 6 + row.get('def_safety', 0) * 2 + row.get('def_block', 0) * 2
+        pts += row.get('def_return_td', 0) * 6 + row.get('def_4th_down_stops', 0) * 0.5
+        pts += row.get('def_tfl', 0) * 0.5 + row.get('def_3_and_out', 0) * 0.5 + row.get('def_xp_return', 0) * 2
+    return round(pts, 2)
+
+
+def random_projections(n, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({stat: rng.integers(0, 6, n) for stat in ylc.STAT_COLUMNS})
+    for stat, high in [("pass_yds", 500), ("rush_yds", 250), ("rec_yds", 250), ("opp_pts", 45), ("opp_yds", 600)]:
+        df[stat] = rng.integers(0, high, n)
+    df["pos"] = rng.choice(ylc.POSITIONS, n)
+    return df
+
+
+def test_engine_matches_legacy_scorer_on_whole_stats():
+    df = random_projections(5000)
+    expected = [legacy_points(row, row["pos"] == "DST") for row in df.to_dict("records")]
+    np.testing.assert_allclose(ylc.SCORING_ENGINE.score(df), expected, atol=1e-9)
+
+
+def test_single_row_wrapper_matches_engine():
+    df = random_projections(200, seed=1)
+    rows = df.to_dict("records")
+    singles = [ylc.calculate_fantasy_points(row, row["pos"] == "DST") for row in rows]
+    np.testing.assert_allclose(ylc.SCORING_ENGINE.score(df), singles)
+
+
+@pytest.mark.parametrize("opp_pts, tier_points", [
+    (0, 12), (0.5, 12), (1, 8), (6.5, 8), (13.9, 6), (20.5, 4), (27.5, 2), (34.5, 0), (35, -5),
+])
+def test_fractional_points_allowed_fall_in_the_tier_below(opp_pts, tier_points):
+    # The old chain had gaps between integer ranges (6.5 scored -5); each tier now runs up to the next bound
+    row = {"opp_pts": opp_pts, "opp_yds": 350}
+    assert ylc.calculate_fantasy_points(row, is_def=True) == tier_points
+
+
+@pytest.mark.parametrize("opp_yds, tier_points", [(99.5, 5), (199.5, 4), (299.5, 2), (399.5, 0), (499.5, -1), (500, -3)])
+def test_fractional_yards_allowed_fall_in_the_tier_below(opp_yds, tier_points):
+    row = {"opp_pts": 28, "opp_yds": opp_yds}
+    assert ylc.calculate_fantasy_points(row, is_def=True) == tier_points
+
+
+def write_profile(tmp_path, name, rules):
+    (tmp_path / "profiles").mkdir(exist_ok=True)
+    (tmp_path / "profiles" / f"{name}.json").write_text(json.dumps(rules))
+    return str(tmp_path / "profiles")
+
+
+def test_profiles_fall_back_to_the_default_rules(tmp_path):
+    path = write_profile(tmp_path, "ppr", {"rec": 1.0, "pass_yds_500": 5, "def_pts_allowed_42_plus": -8})
+    profiles = ylc.load_scoring_profiles(path)
+    assert sorted(profiles) == ["default", "ppr"]
+    assert profiles["ppr"]["rec"] == 1.0 and profiles["ppr"]["pass_td"] == ylc.CUSTOM_SCORING["pass_td"]
+
+
+@pytest.mark.parametrize("rules, message", [
+    ({"rec": 1.0, "recs": 1.0}, "unknown scoring key 'recs'"),
+    ({"pass_yards_300": 3}, "unknown scoring key 'pass_yards_300'"),
+    ({"rec": "1"}, "scoring key 'rec' needs a number"),
+])
+def test_bad_profile_keys_name_the_file_and_key(tmp_path, rules, message):
+    path = write_profile(tmp_path, "typo", rules)
+    with pytest.raises(ValueError, match=message) as err:
+        ylc.load_scoring_profiles(path)
+    assert "typo.json" in str(err.value)
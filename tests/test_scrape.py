@@ -0,0 +1,31 @@
+import time
+
+import YourLeagueConsensus as ylc
+from conftest import fixture_html, local_source, scrape
+
+
+def test_wall_time_tracks_the_slowest_page(page_server):
+    positions = ["QB", "RB", "WR", "TE"]
+    for pos in positions:
+        page_server.pages[f"/{pos.lower()}.html"] = {"body": fixture_html(f"{pos.lower()}.html"), "delay": 0.6}
+    start = time.perf_counter()
+    df = scrape(local_source(page_server, positions))
+    elapsed = time.perf_counter() - start
+    assert sorted(df["pos"].unique()) == sorted(positions)
+    assert elapsed < 1.5  # One delay plus overhead, not the 2.4 s sum
+
+
+def test_failed_and_timed_out_pages_only_lose_their_own_rows(page_server, monkeypatch):
+    monkeypatch.setattr(ylc, "PAGE_TIMEOUT", 0.5)
+    page_server.pages["/qb.html"] = {"body": fixture_html("qb.html")}
+    page_server.pages["/rb.html"] = {"body": fixture_html("rb.html"), "delay": 2}
+    page_server.pages["/wr.html"] = {"status": 500}
+    report = ylc.RunReport()
+    start = time.perf_counter()
+    df = scrape(local_source(page_server, ["QB", "RB", "WR"]), report=report)
+    assert time.perf_counter() - start < 1.5
+    assert set(df["pos"]) == {"QB"}
+    assert len(df) == 50
+    statuses = {url.rsplit("/", 1)[1]: page["status"] for url, page in report.pages.items()}
+    assert statuses == {"qb.html": "parsed", "rb.html": "error", "wr.html": "error"}
+    assert {e["url"].rsplit("/", 1)[1] for e in report.errors} == {"rb.html", "wr.html"}
@@ -0,0 +1,74 @@
+import asyncio
+import json
+import time
+
+import pandas as pd
+
+import YourLeagueConsensus as ylc
+
+
+def rankings():
+    return pd.DataFrame({"overall_rank": [1, 2, 3], "pos_rank": [1, 1, 2], "player": ["A", "B", "C"],
+                         "team": "BUF", "pos": ["WR", "RB", "WR"], "opp": "", "consensus": [20.0, 15.0, 10.0]})
+
+
+async def get(port, target, reader_writer=None):
+    reader, writer = reader_writer or await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: x\r\n\r\n".encode())
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    length = int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+    return json.loads(await reader.readexactly(length)), (reader, writer)
+
+
+def serve(server, client):
+    """Run client(port) against server._handle on an ephemeral port."""
+    async def main():
+        listener = await asyncio.start_server(server._handle, "127.0.0.1", 0)
+        async with listener:
+            return await client(listener.sockets[0].getsockname()[1])
+    return asyncio.run(main())
+
+
+def test_query_values_are_url_decoded():
+    server = ylc.RankingsServer(idle_timeout=1)
+    server.index = ylc.RankingsIndex(rankings())
+    status, body = server._route("/rankings?pos=W%52&limit=1")
+    assert status == 200
+    assert json.loads(body)["total"] == 2
+    assert server._route("/rankings?pos=wr&offset=x")[0] == 400
+
+
+def test_idle_keep_alive_connections_are_closed():
+    server = ylc.RankingsServer(idle_timeout=0.3)
+    server.index = ylc.RankingsIndex(rankings())
+
+    async def client(port):
+        body, (reader, writer) = await get(port, "/rankings")
+        assert body["total"] == 3
+        started = time.perf_counter()
+        assert await asyncio.wait_for(reader.read(), 5) == b""  # Server hung up
+        writer.close()
+        return time.perf_counter() - started
+    assert serve(server, client) < 2
+
+
+def test_requests_are_answered_while_a_refresh_runs(monkeypatch):
+    def slow_cache(columns=None):
+        time.sleep(1)
+        return rankings().drop(columns=["overall_rank", "pos_rank"]).assign(source="S", source_points=[20.0, 15.0, 10.0])
+    monkeypatch.setattr(ylc, "load_cache", slow_cache)
+    server = ylc.RankingsServer(from_cache=True, idle_timeout=5)
+
+    async def client(port):
+        refresh = asyncio.create_task(server.refresh())
+        await asyncio.sleep(0.1)
+        started = time.perf_counter()
+        body, (_, writer) = await get(port, "/rankings")
+        waited = time.perf_counter() - started
+        writer.close()
+        await refresh
+        return body, waited
+    body, waited = serve(server, client)
+    assert body["total"] == 0 and waited < 0.5  # Answered from the old index, not after the refresh
+    assert json.loads(server.index.query())["total"] == 3
@@ -0,0 +1,45 @@
+import pandas as pd
+
+import YourLeagueConsensus as ylc
+from conftest import fixture_html, local_source, scrape
+
+
+def test_pulls_served_from_cache_are_not_stored_again(page_server):
+    page_server.pages["/qb.html"] = {"body": fixture_html("qb.html"), "etag": '"v1"'}
+    sources = local_source(page_server, ["QB"])
+    cache = ylc.FetchCache(path=None)
+    first = scrape(sources, fetch_cache=cache)              # parsed
+    scrape(sources, fetch_cache=cache)                      # inside the TTL
+    cache.ttl = 0
+    latest = scrape(sources, fetch_cache=cache)             # 304
+    store = ylc.SnapshotStore()
+    assert len(store.index) == 1
+    assert latest["timestamp"].nunique() == 1
+    assert latest["timestamp"].iloc[0] == first["timestamp"].iloc[0]
+
+
+def test_changed_page_is_stored_and_shows_up_in_changes(page_server):
+    page_server.pages["/qb.html"] = {"body": fixture_html("qb.html"), "etag": '"v1"'}
+    sources = local_source(page_server, ["QB"])
+    cache = ylc.FetchCache(path=None, ttl=0)
+    scrape(sources, fetch_cache=cache)
+    page_server.pages["/qb.html"] = {"body": fixture_html("qb.html").replace("<td>191.1</td>", "<td>291.1</td>"),
+                                     "etag": '"v2"'}
+    scrape(sources, fetch_cache=cache)
+    scrape(sources, fetch_cache=cache)  # 304 again: no third snapshot
+    store = ylc.SnapshotStore()
+    assert len(store.index) == 2
+    changed = store.changes()
+    assert changed["change"].value_counts().to_dict() == {"unchanged": 49, "changed": 1}
+    assert changed.iloc[0]["player"] == "Renla Kalason"
+    assert changed.iloc[0]["delta"] > 0
+
+
+def test_append_skips_sources_with_nothing_newer(tmp_path):
+    store = ylc.SnapshotStore(str(tmp_path / "snaps"))
+    row = {"player": "A B", "team": "BUF", "pos": "QB", "opp": "", "week": "1", "source_points": 10.0}
+    old = pd.Timestamp("2025-10-01 12:00:00")
+    store.append(pd.DataFrame([{**row, "source": "S1", "timestamp": old}]), season=2025)
+    store.append(pd.DataFrame([{**row, "source": "S1", "timestamp": old},
+                               {**row, "source": "S2", "timestamp": old}]), season=2025)
+    assert sorted(store.index.index.get_level_values("source")) == ["S1", "S2"]
@@ -0,0 +1,77 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+from PyQt6.QtCore import Qt  # noqa: E402
+
+import consensus_gui as gui  # noqa: E402
+
+PLAYER = [c for _, c, _ in gui.TABLE_COLUMNS].index("player")
+FLOOR = [c for _, c, _ in gui.TABLE_COLUMNS].index("floor")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def model():
+    model = gui.ProjectionTableModel()
+    model.set_frame(pd.DataFrame({
+        "overall_rank": [1, 2, 3, 4, 5], "pos_rank": [1, 1, 2, 1, 2],
+        "player": ["Allen", "Hill", "Kelce", "Bills Defense", "Chase"],
+        "team": ["BUF", "MIA", "KC", "BUF", "CIN"], "pos": ["QB", "WR", "TE", "DST", "WR"], "opp": "",
+        "consensus": [25.0, 20.0, 15.0, 10.0, 19.0], "floor": [18.0, np.nan, 9.0, 4.0, 12.0],
+    }))
+    return model
+
+
+def column(model, col=PLAYER):
+    return [model.data(model.index(row, col)) for row in range(model.rowCount())]
+
+
+def test_row_count_and_cells_follow_the_frame(model):
+    assert model.rowCount() == 5 and model.columnCount() == len(gui.TABLE_COLUMNS)
+    assert column(model) == ["Allen", "Hill", "Kelce", "Bills Defense", "Chase"]
+    assert column(model, FLOOR) == ["18.0", "—", "9.0", "4.0", "12.0"]
+    model.set_frame(pd.DataFrame({"player": ["Solo"], "pos": ["K"], "floor": [7.0]}))
+    assert model.rowCount() == 1
+    assert column(model) == ["Solo"]
+    assert model.data(model.index(0, 0)) == "—"  # Columns the frame lacks show as missing
+
+
+def test_position_filter(model):
+    model.set_position("WR")
+    assert column(model) == ["Hill", "Chase"]
+    model.set_position("RB")
+    assert model.rowCount() == 0
+    model.set_position("ALL")
+    assert model.rowCount() == 5
+
+
+def test_sort_both_ways_with_missing_values_last(model):
+    model.sort(FLOOR, Qt.SortOrder.AscendingOrder)
+    assert column(model) == ["Bills Defense", "Kelce", "Chase", "Allen", "Hill"]
+    model.sort(FLOOR, Qt.SortOrder.DescendingOrder)
+    assert column(model) == ["Allen", "Chase", "Kelce", "Bills Defense", "Hill"]
+
+
+def test_sort_order_is_reused_across_position_changes(model):
+    model.sort(FLOOR, Qt.SortOrder.DescendingOrder)
+    cached = model._orders[(FLOOR, Qt.SortOrder.DescendingOrder)]
+    model.set_position("WR")
+    assert column(model) == ["Chase", "Hill"]
+    model.set_position("ALL")
+    assert model._orders[(FLOOR, Qt.SortOrder.DescendingOrder)] is cached
+    assert len(model._orders) == 1
+
+
+def test_defenses_are_green(model):
+    colors = [model.data(model.index(row, 0), Qt.ItemDataRole.ForegroundRole) for row in range(model.rowCount())]
+    assert [c is not None for c in colors] == [False, False, False, True, False]
+    assert colors[3].getRgb()[:3] == (0, 255, 0)